@@ -4,6 +4,7 @@ Reusable batch operation helpers for Supabase operations.
 Consolidates common patterns from upload scripts.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from ..supabase_client import supabase
 from ..settings import settings
@@ -32,7 +33,8 @@ def batch_upsert(
     data: List[Dict],
     conflict_key: str,
     batch_size: Optional[int] = None,
-    description: str = "records"
+    description: str = "records",
+    return_rows: bool = False
 ) -> Dict[str, Any]:
     """
     Upsert data in batches to a Supabase table.
@@ -43,9 +45,12 @@ def batch_upsert(
         conflict_key: Key to use for conflict resolution
         batch_size: Size of each batch (uses default if None)
         description: Description for logging
+        return_rows: If True, collect every row the upsert returns under
+            results['rows']
         
     Returns:
         Dictionary with results: {'uploaded': int, 'errors': List[str]}
+        (plus 'rows': List[Dict] when return_rows is True)
     """
     if batch_size is None:
         batch_size = settings.DEFAULT_BATCH_SIZE
@@ -55,6 +60,8 @@ def batch_upsert(
         'uploaded': 0,
         'errors': []
     }
+    if return_rows:
+        results['rows'] = []
     
     if not data:
         return results
@@ -76,6 +83,8 @@ def batch_upsert(
             
             uploaded_count = len(response.data) if response.data else len(batch)
             results['uploaded'] += uploaded_count
+            if return_rows:
+                results['rows'].extend(response.data or [])
             
             print(f"   ✅ Uploaded {uploaded_count} {description}")
             
@@ -91,23 +100,30 @@ def batch_update(
     updates: List[Dict],
     id_field: str = 'id',
     batch_size: Optional[int] = None,
-    description: str = "records"
+    description: str = "records",
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Update records in batches with transaction safety.
     
+    Each record is its own UPDATE request, so requests within a batch are
+    sent concurrently on a small thread pool.
+    
     Args:
         table_name: Name of the target table
         updates: List of update records (must include id_field)
         id_field: Field to use for identifying records to update
         batch_size: Size of each batch
         description: Description for logging
+        max_workers: Concurrent UPDATE requests (uses default if None)
         
     Returns:
         Dictionary with results: {'updated': int, 'errors': List[str]}
     """
     if batch_size is None:
         batch_size = settings.DEFAULT_BATCH_SIZE
+    if max_workers is None:
+        max_workers = settings.DEFAULT_MAX_WORKERS
     
     results = {
         'total': len(updates),
@@ -118,39 +134,39 @@ def batch_update(
     if not updates:
         return results
     
-    print(f"🔄 Updating {len(updates)} {description} in {table_name}")
-    
-    for i in range(0, len(updates), batch_size):
-        batch = updates[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(updates) + batch_size - 1) // batch_size
+    def update_one(update_record: Dict) -> bool:
+        record_id = update_record[id_field]
         
-        print(f"   Processing batch {batch_num}/{total_batches} ({len(batch)} {description})")
+        # Extract update fields (exclude the ID field)
+        update_fields = {k: v for k, v in update_record.items() if k != id_field}
         
+        # Failures are recorded per record so the rest of the batch still counts
         try:
-            # Use individual UPDATE operations to avoid upsert issues
-            batch_updated = 0
-            for update_record in batch:
-                record_id = update_record[id_field]
-                
-                # Extract update fields (exclude the ID field)
-                update_fields = {k: v for k, v in update_record.items() if k != id_field}
-                
-                # Perform UPDATE operation
-                response = supabase.table(table_name).update(update_fields).eq(id_field, record_id).execute()
-                
-                # Count successful updates (Supabase returns updated records)
-                if response.data and len(response.data) > 0:
-                    batch_updated += 1
+            response = supabase.table(table_name).update(update_fields).eq(id_field, record_id).execute()
+        except Exception as e:
+            error_msg = f"Update of {id_field}={record_id} failed: {str(e)}"
+            print(f"   ❌ {error_msg}")
+            results['errors'].append(error_msg)
+            return False
+        
+        # Count successful updates (Supabase returns updated records)
+        return bool(response.data)
+    
+    print(f"🔄 Updating {len(updates)} {description} in {table_name}")
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i in range(0, len(updates), batch_size):
+            batch = updates[i:i + batch_size]
+            batch_num = (i // batch_size) + 1
+            total_batches = (len(updates) + batch_size - 1) // batch_size
+            
+            print(f"   Processing batch {batch_num}/{total_batches} ({len(batch)} {description})")
             
+            # Use individual UPDATE operations to avoid upsert issues
+            batch_updated = sum(executor.map(update_one, batch))
             results['updated'] += batch_updated
             
             print(f"   ✅ Updated {batch_updated} {description}")
-            
-        except Exception as e:
-            error_msg = f"Batch {batch_num} failed: {str(e)}"
-            print(f"   ❌ {error_msg}")
-            results['errors'].append(error_msg)
     
     return results
 
@@ -189,9 +205,11 @@ def batch_delete(
     print(f"🗑️  Deleting {len(condition_values)} {description} from {table_name}")
     
     try:
-        for value in condition_values:
-            supabase.table(table_name).delete().eq(condition_field, value).execute()
-            results['deleted'] += 1
+        # One DELETE ... WHERE field IN (...) per batch; batch size also bounds the URL length
+        for i in range(0, len(condition_values), batch_size):
+            batch = condition_values[i:i + batch_size]
+            supabase.table(table_name).delete().in_(condition_field, batch).execute()
+            results['deleted'] += len(batch)
         
         print(f"   ✅ Deleted {results['deleted']} {description}")
         
@@ -4,7 +4,7 @@ Course table database operations.
 All Supabase course table interactions go here.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from ..supabase_client import supabase
 from .batch_helpers import batch_upsert, batch_update, create_lookup_map
 
@@ -34,6 +34,26 @@ def get_courses_lookup() -> Dict[str, str]:
     return create_lookup_map('courses', 'code', 'id')
 
 
+def get_courses_catalog_text() -> Dict[str, Tuple[str, str]]:
+    """
+    Get current catalog text for all courses: id -> (description, prerequisites_text).
+    
+    NULL values are returned as '' so they compare equal to empty scraped fields.
+    
+    Returns:
+        Dictionary mapping course id to (description, prerequisites_text)
+    """
+    try:
+        response = supabase.table('courses').select('id, description, prerequisites_text').execute()
+        return {
+            course['id']: (course.get('description') or '', course.get('prerequisites_text') or '')
+            for course in response.data
+        }
+    except Exception as e:
+        print(f"❌ Failed to fetch course catalog text: {e}")
+        return {}
+
+
 def get_courses_without_department_id() -> List[Dict]:
     """
     Get all courses that don't have a department_id set.
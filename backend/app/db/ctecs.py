@@ -196,45 +196,34 @@ def clear_offering_snapshot_data(course_offering_id: str) -> Dict:
     }
     
     try:
-        # First, get counts before deletion for accurate reporting
-        comments_before = len(get_comments_by_offering(course_offering_id))
-        ratings_before = len(get_ratings_by_offering(course_offering_id))
-        
-        # Get distribution count before deletion (via ratings)
-        distributions_before = 0
+        # Rating IDs are needed to scope the distribution delete
         ratings = get_ratings_by_offering(course_offering_id)
-        for rating in ratings:
-            distributions_before += len(get_rating_distributions(rating['id']))
+        rating_ids = [rating['id'] for rating in ratings]
         
-        # Delete rating distributions first (to avoid foreign key issues)
-        for rating in ratings:
-            supabase.table('ratings_distribution').delete().eq(
-                'rating_id', rating['id']
+        # Delete rating distributions first (to avoid foreign key issues), in one request.
+        # Deletes return the removed rows, so counts come from the responses.
+        if rating_ids:
+            response = supabase.table('ratings_distribution').delete().in_(
+                'rating_id', rating_ids
             ).execute()
+            results['distributions_deleted'] = len(response.data or [])
         
         # Delete comments for this offering
-        supabase.table('comments').delete().eq(
+        response = supabase.table('comments').delete().eq(
             'course_offering_id', course_offering_id
         ).execute()
+        results['comments_deleted'] = len(response.data or [])
         
         # Delete ratings for this offering
-        supabase.table('ratings').delete().eq(
+        response = supabase.table('ratings').delete().eq(
             'course_offering_id', course_offering_id
         ).execute()
-        
-        # Use the counts we obtained before deletion
-        results['comments_deleted'] = comments_before
-        results['ratings_deleted'] = ratings_before
-        results['distributions_deleted'] = distributions_before
+        results['ratings_deleted'] = len(response.data or [])
         
         print(f"🗑️  Cleared snapshot data for offering {course_offering_id}: "
               f"{results['comments_deleted']} comments, {results['ratings_deleted']} ratings, "
               f"{results['distributions_deleted']} distributions")
         
-        # Brief pause to ensure database consistency
-        import time
-        time.sleep(0.1)
-        
     except Exception as e:
         error_msg = f"Failed to clear snapshot data for offering {course_offering_id}: {e}"
         print(f"❌ {error_msg}")
@@ -332,10 +321,12 @@ def upsert_comments(comments: List[Dict], batch_size: int = 500) -> Dict:
 
 def insert_comments(comments: List[Dict], batch_size: int = 500) -> Dict:
     """
-    Insert comments in batches (for snapshot replacement - no conflict resolution).
+    Insert comments in batches (for snapshot replacement).
     
-    Used in the "replace snapshot" model where comments are pre-cleared
-    and we need clean insertion without upsert logic.
+    Used in the "replace snapshot" model where comments are pre-cleared.
+    Rows that already exist for the same (course_offering_id, content_hash)
+    are skipped by the database (ON CONFLICT DO NOTHING) instead of failing
+    the batch, and are not counted as inserted.
     
     Args:
         comments: List of comment records with course_offering_id, content, content_hash
@@ -363,8 +354,12 @@ def insert_comments(comments: List[Dict], batch_size: int = 500) -> Dict:
         print(f"   Processing batch {batch_num}/{total_batches} ({len(batch)} comments)")
         
         try:
-            response = supabase.table('comments').insert(batch).execute()
-            inserted_count = len(response.data) if response.data else len(batch)
+            response = supabase.table('comments').upsert(
+                batch,
+                on_conflict='course_offering_id,content_hash',
+                ignore_duplicates=True
+            ).execute()
+            inserted_count = len(response.data or [])
             results['inserted'] += inserted_count
             print(f"   ✅ Inserted {inserted_count} comments")
             
@@ -400,20 +395,26 @@ def upsert_ratings(ratings: List[Dict], batch_size: int = 100) -> Dict:
     """
     Upsert ratings in batches.
     
+    The upserted rows (including their IDs) are returned so callers don't need
+    to query them back.
+    
     Args:
         ratings: List of rating records with course_offering_id, survey_question_id
         batch_size: Number of records per batch
         
     Returns:
-        Dictionary with upload results: {'total', 'uploaded', 'errors'}
+        Dictionary with upload results: {'total', 'uploaded', 'ratings', 'errors'}
     """
-    return batch_upsert(
+    results = batch_upsert(
         table_name='ratings',
         data=ratings,
         conflict_key='course_offering_id,survey_question_id',
         batch_size=batch_size,
-        description='ratings'
+        description='ratings',
+        return_rows=True
     )
+    results['ratings'] = results.pop('rows')
+    return results
 
 
 def insert_ratings(ratings: List[Dict], batch_size: int = 100) -> Dict:
@@ -421,18 +422,21 @@ def insert_ratings(ratings: List[Dict], batch_size: int = 100) -> Dict:
     Insert ratings in batches (for snapshot replacement - no conflict resolution).
     
     Used in the "replace snapshot" model where ratings are pre-cleared
-    and we need clean insertion without upsert logic.
+    and we need clean insertion without upsert logic. The inserted rows
+    (including their generated IDs) are returned so callers don't need to
+    query them back.
     
     Args:
         ratings: List of rating records with course_offering_id, survey_question_id
         batch_size: Number of records per batch
         
     Returns:
-        Dictionary with insert results: {'total', 'inserted', 'errors'}
+        Dictionary with insert results: {'total', 'inserted', 'ratings', 'errors'}
     """
     results = {
         'total': len(ratings),
         'inserted': 0,
+        'ratings': [],
         'errors': []
     }
     
@@ -452,6 +456,7 @@ def insert_ratings(ratings: List[Dict], batch_size: int = 100) -> Dict:
             response = supabase.table('ratings').insert(batch).execute()
             inserted_count = len(response.data) if response.data else len(batch)
             results['inserted'] += inserted_count
+            results['ratings'].extend(response.data or [])
             print(f"   ✅ Inserted {inserted_count} ratings")
             
         except Exception as e:
@@ -482,6 +487,37 @@ def get_survey_question_options(survey_question_id: str) -> List[Dict]:
         return []
 
 
+def get_survey_question_options_bulk(survey_question_ids: List[str]) -> Dict[str, List[Dict]]:
+    """
+    Get options for several survey questions in a single query.
+    
+    Args:
+        survey_question_ids: UUIDs of the survey questions
+        
+    Returns:
+        Dictionary mapping survey question id to its option records (ordered by ordinal)
+    """
+    options_by_question: Dict[str, List[Dict]] = {}
+    
+    if not survey_question_ids:
+        return options_by_question
+    
+    try:
+        response = supabase.table('survey_question_options') \
+            .select('*') \
+            .in_('survey_question_id', list(survey_question_ids)) \
+            .order('ordinal') \
+            .execute()
+        
+        for option in response.data or []:
+            options_by_question.setdefault(option['survey_question_id'], []).append(option)
+        
+        return options_by_question
+    except Exception as e:
+        print(f"❌ Failed to fetch options for {len(survey_question_ids)} questions: {e}")
+        return {}
+
+
 def upsert_survey_question_options(options: List[Dict], batch_size: int = 100) -> Dict:
     """
     Upsert survey question options in batches.
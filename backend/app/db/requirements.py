@@ -194,13 +194,14 @@ def upsert_course_requirements(course_requirement_pairs: List[Dict], batch_size:
     )
 
 
-def update_course_requirements(course_ids: List[str], course_requirement_pairs: List[Dict]) -> Dict:
+def update_course_requirements(course_ids: List[str], course_requirement_pairs: List[Dict], batch_size: int = 500) -> Dict:
     """
     Replace all requirements for specified courses (delete old + insert new).
     
     Args:
         course_ids: List of course UUIDs to update
         course_requirement_pairs: New course-requirement associations
+        batch_size: Number of links per upsert batch
         
     Returns:
         Dictionary with operation results: {'cleared', 'linked', 'errors'}
@@ -214,7 +215,7 @@ def update_course_requirements(course_ids: List[str], course_requirement_pairs:
     
     # Add new requirements
     if course_requirement_pairs:
-        link_results = upsert_course_requirements(course_requirement_pairs)
+        link_results = upsert_course_requirements(course_requirement_pairs, batch_size)
         results['linked'] = link_results.get('uploaded', 0)
         results['errors'].extend(link_results.get('errors', []))
     
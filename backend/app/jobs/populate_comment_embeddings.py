@@ -13,7 +13,10 @@ Usage:
 
 import sys
 import argparse
+import hashlib
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
 from ..core.openai_client import get_openai_client
@@ -21,15 +24,58 @@ from ..db.rag import (
     get_existing_comment_chunk_ids,
     get_comments_with_offering_data,
     get_chunks_without_embeddings,
-    insert_rag_chunk,
+    batch_insert_rag_chunks,
+    batch_insert_rag_embeddings,
     insert_rag_embedding,
     delete_chunk,
     get_rag_stats
 )
+from ..settings import settings
 from ..utils.logging import get_job_logger
 
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
+EMBEDDING_CACHE_SIZE = 1024
+EMBEDDING_MAX_INPUTS_PER_REQUEST = 2048  # OpenAI embeddings API limit
+
+# In-process LRU of (model, text) -> embedding so repeated comment texts
+# ("N/A", "Great class!") are only sent to the API once per run
+_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
+
+def _embedding_cache_key(text: str) -> str:
+    """Build the cache key for a text under the current embedding model."""
+    return hashlib.sha256(f"{EMBEDDING_MODEL}\0{text}".encode('utf-8')).hexdigest()
+
+
+def _request_embeddings(texts: List[str], client) -> List[List[float]]:
+    """
+    Call the embeddings API, splitting into concurrent requests above the API's input limit.
+
+    Args:
+        texts: List of text strings to embed
+        client: OpenAI client instance
+
+    Returns:
+        List of embedding vectors, in the same order as texts
+    """
+    def embed(batch: List[str]) -> List[List[float]]:
+        response = client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=batch
+        )
+        # Sort by index to maintain order
+        return [e.embedding for e in sorted(response.data, key=lambda x: x.index)]
+
+    batches = [
+        texts[i:i + EMBEDDING_MAX_INPUTS_PER_REQUEST]
+        for i in range(0, len(texts), EMBEDDING_MAX_INPUTS_PER_REQUEST)
+    ]
+    if len(batches) == 1:
+        return embed(batches[0])
+
+    with ThreadPoolExecutor(max_workers=settings.DEFAULT_MAX_WORKERS) as executor:
+        return [embedding for batch in executor.map(embed, batches) for embedding in batch]
 
 
 def generate_embedding_single(text: str, client) -> List[float]:
@@ -46,35 +92,48 @@ def generate_embedding_single(text: str, client) -> List[float]:
     Raises:
         Exception on API failure
     """
-    response = client.embeddings.create(
-        model=EMBEDDING_MODEL,
-        input=[text]
-    )
-    return response.data[0].embedding
+    return generate_embeddings([text], client)[0]
 
 
 def generate_embeddings(texts: List[str], client) -> List[List[float]]:
     """
     Generate embeddings for a batch of texts using OpenAI.
 
+    Texts already embedded earlier in the run are served from an in-process
+    cache, and duplicate texts within the batch are only sent once.
+
     Args:
         texts: List of text strings to embed
         client: OpenAI client instance
 
     Returns:
-        List of embedding vectors
+        List of embedding vectors, in the same order as texts
     """
     logger = get_job_logger('populate_comment_embeddings')
 
+    keys = [_embedding_cache_key(text) for text in texts]
+    resolved: Dict[str, List[float]] = {}
+    missing: Dict[str, str] = {}
+
+    for key, text in zip(keys, texts):
+        if key in _embedding_cache:
+            _embedding_cache.move_to_end(key)
+            resolved[key] = _embedding_cache[key]
+        elif key not in missing:
+            missing[key] = text
+
+    if not missing:
+        return [resolved[key] for key in keys]
+
     try:
-        response = client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=texts
-        )
+        embeddings = _request_embeddings(list(missing.values()), client)
+        for key, embedding in zip(missing, embeddings):
+            resolved[key] = embedding
+            _embedding_cache[key] = embedding
+            if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
 
-        # Sort by index to maintain order
-        embeddings = sorted(response.data, key=lambda x: x.index)
-        return [e.embedding for e in embeddings]
+        return [resolved[key] for key in keys]
 
     except Exception as e:
         logger.error("Failed to generate embeddings: %s", e)
@@ -262,51 +321,74 @@ def process_comments_batch(
         results['errors'].append(error_msg)
         return results
 
-    # Step 2: Insert chunks and embeddings one by one
-    for i, comment in enumerate(comments):
-        try:
-            # Insert chunk
-            chunk = insert_rag_chunk(
-                entity_type='comment',
-                entity_id=comment['id'],
-                content=comment['content'],
-                chunk_type='student_comment',
-                course_id=comment.get('course_id'),
-                instructor_id=comment.get('instructor_id'),
-                course_offering_id=comment.get('course_offering_id'),
-                chunk_index=0
-            )
-
-            if not chunk:
-                error_msg = f"Failed to insert chunk for comment {comment['id']}"
-                logger.error(error_msg)
-                results['failed'] += 1
-                results['errors'].append(error_msg)
-                continue
-
-            results['chunks_created'] += 1
+    # Step 2: Insert all chunks for the batch in one request
+    chunk_records = [
+        {
+            'entity_type': 'comment',
+            'entity_id': comment['id'],
+            'content': comment['content'],
+            'chunk_type': 'student_comment',
+            'course_id': comment.get('course_id'),
+            'instructor_id': comment.get('instructor_id'),
+            'course_offering_id': comment.get('course_offering_id'),
+            'chunk_index': 0,
+            'metadata': {}
+        }
+        for comment in comments
+    ]
+
+    chunks = batch_insert_rag_chunks(chunk_records)
+    if not chunks:
+        error_msg = f"Failed to insert chunks for batch of {len(comments)} comments"
+        logger.error(error_msg)
+        results['failed'] = len(comments)
+        results['errors'].append(error_msg)
+        return results
 
-            # Insert embedding
-            embedding_result = insert_rag_embedding(
-                chunk_id=chunk['id'],
-                embedding=embeddings[i],
-                model=EMBEDDING_MODEL
-            )
+    results['chunks_created'] = len(chunks)
 
-            if embedding_result:
+    # Step 3: Insert all embeddings for the inserted chunks in one request
+    embeddings_by_comment_id = {
+        comment['id']: embedding for comment, embedding in zip(comments, embeddings)
+    }
+    embedding_records = [
+        {
+            'chunk_id': chunk['id'],
+            'embedding': embeddings_by_comment_id[chunk['entity_id']],
+            'model': EMBEDDING_MODEL
+        }
+        for chunk in chunks
+    ]
+
+    inserted_embeddings = batch_insert_rag_embeddings(embedding_records)
+    results['embeddings_created'] = len(inserted_embeddings)
+
+    if len(inserted_embeddings) < len(chunks):
+        # A failed bulk insert would leave the whole batch orphaned, so retry the
+        # missing chunks one at a time and remove any that still fail
+        inserted_chunk_ids = {embedding['chunk_id'] for embedding in inserted_embeddings}
+        missing_records = [r for r in embedding_records if r['chunk_id'] not in inserted_chunk_ids]
+        logger.warning("Retrying %d embedding(s) individually", len(missing_records))
+
+        for record in missing_records:
+            if insert_rag_embedding(
+                chunk_id=record['chunk_id'],
+                embedding=record['embedding'],
+                model=record['model']
+            ):
                 results['embeddings_created'] += 1
-            else:
-                error_msg = f"Failed to insert embedding for chunk {chunk['id']} (comment {comment['id']})"
-                logger.error(error_msg)
-                results['errors'].append(error_msg)
-                # Note: This creates an orphaned chunk - use --repair to fix
+                continue
 
-        except Exception as e:
-            error_msg = f"Error processing comment {comment['id']}: {e}"
+            error_msg = f"Failed to insert embedding for chunk {record['chunk_id']}"
             logger.error(error_msg)
             results['failed'] += 1
             results['errors'].append(error_msg)
 
+            # Drop the chunk so its comment is picked up again on the next run
+            if delete_chunk(record['chunk_id']):
+                results['chunks_created'] -= 1
+            # Note: If the delete fails too, the chunk is orphaned - use --repair to fix
+
     return results
 
 
@@ -53,6 +53,7 @@ def print_detailed_summary(results):
     print(f"   📚 Courses from catalog: {total_courses}")
     print(f"   ✅ Found in database: {matched_courses}")
     print(f"   📝 Updated successfully: {updated_courses}")
+    print(f"   ⏭️  Already up to date: {results.get('courses_unchanged', 0)}")
     if len(missing_courses) > 0:
         print(f"   ❌ Missing from database: {len(missing_courses)} (skipped)")
     
@@ -88,6 +89,7 @@ Examples:
   python -m app.jobs.scrape_catalog --departments COMP_SCI,MATH # Scrape specific departments
   python -m app.jobs.scrape_catalog --save-only                 # Scrape and save, don't upload
   python -m app.jobs.scrape_catalog --empty-only                # Only update courses with empty catalog data
+  python -m app.jobs.scrape_catalog --workers 6                 # Scrape 6 departments concurrently
         """
     )
     
@@ -115,6 +117,11 @@ Examples:
         action='store_true',
         help='Only update courses with completely empty catalog data (no description, prerequisites, or requirements)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of departments to scrape concurrently (default: 3)'
+    )
     
     args = parser.parse_args()
     
@@ -136,7 +143,8 @@ Examples:
             dry_run=args.dry_run,
             department_filter=department_filter,
             limit_departments=args.limit,
-            empty_courses_only=args.empty_only
+            empty_courses_only=args.empty_only,
+            max_workers=args.workers
         )
         
         if 'error' in results:
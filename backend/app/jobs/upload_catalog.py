@@ -31,6 +31,7 @@ def print_summary(results: dict):
     
     print(f"Total courses processed: {results.get('total_courses', 0)}")
     print(f"Courses matched & updated: {results.get('courses_updated', 0)}")
+    print(f"Courses already up to date: {results.get('courses_unchanged', 0)}")
     print(f"Course-requirement links: {results.get('requirements_linked', 0)}")
     print(f"Unique requirements: {results.get('requirements_found', 0)}")
     
@@ -50,7 +51,8 @@ def print_summary(results: dict):
             print(f"   • {error}")
     
     if results.get('total_courses', 0) > 0:
-        success_rate = (results.get('courses_updated', 0) / results['total_courses']) * 100
+        up_to_date = results.get('courses_updated', 0) + results.get('courses_unchanged', 0)
+        success_rate = (up_to_date / results['total_courses']) * 100
         print(f"\nSuccess rate: {success_rate:.1f}%")
 
 
@@ -28,6 +28,8 @@ def print_batch_summary(results: dict):
     print(f"Upload failures: {results.get('upload_failures', 0)}")
     print(f"Success rate: {results.get('success_rate', 0):.1f}%")
     print(f"Total time: {results.get('total_time', 'Unknown')}")
+    if results.get('results_path'):
+        print(f"Per-file results: {results['results_path']}")
     
     errors = results.get('errors', [])
     if errors:
@@ -85,6 +87,9 @@ Examples:
   python -m app.jobs.upload_ctecs --all                             # Upload all files in docs/upload
   python -m app.jobs.upload_ctecs --all --upload-dir /custom/dir    # Use custom directory
   python -m app.jobs.upload_ctecs --file doc.pdf --debug            # Enable debug mode
+  python -m app.jobs.upload_ctecs --all --cache-dir scraped_data/ctec_cache  # Reuse parses of unchanged PDFs
+  python -m app.jobs.upload_ctecs --all --workers 4                 # Parse 4 PDFs concurrently
+  python -m app.jobs.upload_ctecs --all --results-file results.jsonl  # Write each file's result as JSON Lines
         """
     )
     
@@ -118,6 +123,21 @@ Examples:
         action='store_true',
         help='Continue processing even if OCR validation fails'
     )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Cache parse results by PDF content hash in this directory (disabled by default)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of PDFs to parse concurrently in batch mode (default: CPU count)'
+    )
+    parser.add_argument(
+        '--results-file',
+        type=str,
+        help='Write each file\'s result to this JSON Lines file in batch mode'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -137,7 +157,8 @@ Examples:
         continue_on_ocr_errors=args.continue_on_errors,
         extract_comments=True,
         extract_demographics=True,
-        extract_time_survey=True
+        extract_time_survey=True,
+        cache_dir=args.cache_dir
     )
     
     try:
@@ -184,7 +205,13 @@ Examples:
                 sys.exit(1)
             
             print(f"🚀 Batch uploading from: {upload_dir}")
-            results = process_ctec_batch(upload_dir, dry_run=args.dry_run, parser_config=parser_config)
+            results = process_ctec_batch(
+                upload_dir,
+                dry_run=args.dry_run,
+                parser_config=parser_config,
+                max_workers=args.workers,
+                results_path=Path(args.results_file) if args.results_file else None
+            )
             
             if 'error' in results:
                 print(f"❌ Error: {results['error']}")
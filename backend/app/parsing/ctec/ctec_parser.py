@@ -5,30 +5,39 @@ This module provides a comprehensive parser for Northwestern University's
 Course and Teacher Evaluation (CTEC) PDF documents.
 """
 
+import hashlib
+import io
+import json
 import re
 import os
+import tempfile
 import numpy as np
 import cv2
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from pypdf import PdfReader
 from PIL import Image
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_bytes
 from .constants import DEPARTMENTS, CLASS_YEAR, DISTRIBUTION_REQUIREMENT, PRIOR_INTEREST, TIME_RANGES
 
+# Part of the parse cache key. Bump whenever extraction patterns, OCR settings or
+# output structure change, so cached results from older parser logic are not reused.
+PARSER_CACHE_VERSION = 1
+
 
 @dataclass
 class ParserConfig:
     """Configuration options for CTECParser."""
     debug: bool = False
-    ocr_dpi: int = 300
+    ocr_dpi: int = 200  # Sufficient for the tabular rating blocks; raise to 300 for poor scans
     ocr_timeout_seconds: int = 30
     validate_ocr_totals: bool = True
     continue_on_ocr_errors: bool = False
     extract_comments: bool = True
     extract_demographics: bool = True
     extract_time_survey: bool = True
+    cache_dir: Optional[str] = None  # Directory for parse results keyed by PDF content hash
 
 
 @dataclass
@@ -58,6 +67,28 @@ class CTECData:
             'comments': self.comments,
             'survey_responses': self.survey_responses
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CTECData':
+        """
+        Rebuild CTECData from the output of to_dict (e.g. after a JSON round-trip).
+        
+        JSON object keys are always strings, so numeric option keys (ratings 1-6,
+        prior interest 1-6) are converted back to int.
+        """
+        course_info = CourseInfo(**{f.name: data[f.name] for f in fields(CourseInfo)})
+        survey_responses = {
+            question: {
+                int(key) if isinstance(key, str) and key.isdigit() else key: count
+                for key, count in distribution.items()
+            }
+            for question, distribution in data['survey_responses'].items()
+        }
+        return cls(
+            course_info=course_info,
+            comments=data['comments'],
+            survey_responses=survey_responses
+        )
 
 
 class CTECParsingError(Exception):
@@ -92,12 +123,15 @@ class CTECParser:
     
     def _setup_patterns(self):
         """Initialize regex patterns for text extraction."""
-        # Course info patterns
-        self.course_pattern1 = re.compile(
-            r"Student Report for (.*?)\((.*?)\)\s*\(([^)]+)\)"
-        )
-        self.course_pattern2 = re.compile(
-            r"Student Report for ([^:]+):\s*(.*?)\s*\(([^)]+)\)"
+        # Course info patterns, combined so one search finds the earliest match:
+        # 1: "Title (CODE_SECTION: Description) (Instructor)"
+        # 2: "CODE: Title (Instructor)"
+        # Alternative 1 is tried first, so it wins when both match at the same offset
+        self.course_pattern = re.compile(
+            r"Student Report for (?:"
+            r"(?P<title1>.*?)\((?P<codes1>.*?)\)\s*\((?P<instructor1>[^)]+)\)"
+            r"|(?P<code2>[^:]+):\s*(?P<title2>.*?)\s*\((?P<instructor2>[^)]+)\)"
+            r")"
         )
         
         # Term info pattern
@@ -114,52 +148,105 @@ class CTECParser:
         )
         
         # OCR distribution patterns - flexible to handle various formats
-        # Matches: "1-Very Low (0)", "2 (1)", "6-Very High (24)", etc.
+        # Matches: "1-Very Low (0)", "2 (1)", "6-Very High (24)", etc. as rating/count,
+        # and "Total (25)" as total, so one scan yields both the counts and the total
         self.dist_pattern = re.compile(
-            r"(?i)([1-6])(?:[-–—]\s*(?:Very\s+Low|Very\s+High|[A-Za-z\s–—-]*?))?\s*\((\d+)\)"
+            r"(?i)(?P<rating>[1-6])(?:[-–—]\s*(?:Very\s+Low|Very\s+High|[A-Za-z\s–—-]*?))?\s*\((?P<count>\d+)\)"
+            r"|(?:total|\[?\s*total\s*\]?)\s*\((?P<total>\d+)\)"
         )
-        self.total_pattern = re.compile(
-            r"(?i)(?:total|\[?\s*total\s*\]?)\s*\((\d+)\)", 
-            re.IGNORECASE
+        
+        # Fallback OCR distribution patterns used when totals do not reconcile
+        self.alt_dist_bracket_pattern = re.compile(r"([1-6])[^\d]*?[\(\[\{](\d+)[\)\]\}]")
+        self.alt_dist_line_pattern = re.compile(r"(?:^|\s)([1-6])(?:\s*[-–—]\s*\w+)?\s*[\(\[]?(\d+)[\)\]]?")
+        
+        # Section markers in the cleaned text, located together in one pass
+        self.section_marker_pattern = re.compile(
+            r"DEMOGRAPHICS|TIME-SURVEY QUESTION|ESSAY QUESTIONS|Essay Questions"
         )
         
+        # Demographic option patterns - compiled once as (category, key, pattern)
+        demographic_categories = [
+            (DEPARTMENTS, "What is the name of your school?"),
+            (CLASS_YEAR, "Your Class"),
+            (DISTRIBUTION_REQUIREMENT, "What is your reason for taking the course? (mark all that apply)"),
+            (PRIOR_INTEREST, "What was your Interest in this subject before taking the course?")
+        ]
+        self.demographic_patterns = []
+        for items, category in demographic_categories:
+            for item in items:
+                key = item
+                if category == "What was your Interest in this subject before taking the course?":
+                    if item == "1-Not interested at all":
+                        key = "1"
+                    elif item == "6-Extremely interested":
+                        key = "6"
+                    key = int(key) if key.isdigit() else key
+                
+                pattern = re.compile(rf"{re.escape(item)}\s+(\d+)\s+[\d.]+%")
+                self.demographic_patterns.append((category, key, pattern))
+        
         # Survey question patterns - keys match actual question text
-        self.survey_questions = {
+        survey_question_patterns = {
             "Provide an overall rating of the instruction": r"1\.\s*Provide an overall rating of the instruction.*?(?=2\.\s*Provide)",
             "Provide an overall rating of the course": r"2\.\s*Provide an overall rating of the course.*?(?=3\.\s*Estimate)",
             "Estimate how much you learned in the course": r"3\.\s*Estimate how much you learned in the course.*?(?=4\.\s*Rate)",
             "Rate the effectiveness of the course in challenging you intellectually": r"4\.\s*Rate the effectiveness of the course in challenging you intellectually.*?(?=5\.\s*Rate)",
             "Rate the effectiveness of the instructor in stimulating your interest in the subject": r"5\.\s*Rate the effectiveness of the instructor in stimulating your interest in the subject.*"
         }
+        self.survey_questions = {
+            question: re.compile(pattern, re.S)
+            for question, pattern in survey_question_patterns.items()
+        }
     
     def _log_debug(self, message: str):
         """Log debug message if debug mode is enabled."""
         if self.debug:
             print(f"[DEBUG] {message}")
     
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
+    def _read_pdf_bytes(self, pdf_path: str) -> bytes:
         """
-        Extract raw text from PDF file.
+        Read the PDF file into memory once so every stage can share it.
         
         Args:
             pdf_path: Path to the PDF file
             
         Returns:
-            Raw text extracted from all pages
+            Raw bytes of the PDF file
             
         Raises:
-            CTECParsingError: If file doesn't exist or text extraction fails
+            CTECParsingError: If file doesn't exist or cannot be read
         """
         if not os.path.exists(pdf_path):
             raise CTECParsingError(f"PDF file not found: {pdf_path}")
         
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
+            with open(pdf_path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            raise CTECParsingError(f"Failed to read {pdf_path}: {e}")
+    
+    def _extract_text_from_pdf(self, pdf_bytes: bytes, pdf_path: str) -> str:
+        """
+        Extract raw text from PDF file.
+        
+        Args:
+            pdf_bytes: Raw bytes of the PDF file
+            pdf_path: Path to the PDF file for error reporting
+            
+        Returns:
+            Raw text extracted from all pages
+            
+        Raises:
+            CTECParsingError: If text extraction fails
+        """
+        try:
+            reader = PdfReader(io.BytesIO(pdf_bytes))
+            page_texts = []
             for page in reader.pages:
                 extracted = page.extract_text()
                 if extracted:
-                    text += extracted + "\n"
+                    page_texts.append(extracted)
+            text = "\n".join(page_texts)
             
             if not text.strip():
                 raise CTECParsingError(f"No text extracted from {pdf_path}")
@@ -180,7 +267,23 @@ class CTECParser:
         """
         if not text:
             return ""
-        return ' '.join(line.strip() for line in text.splitlines() if line.strip())
+        # Strip each line once (in C via map) and drop the empty ones
+        return ' '.join(filter(None, map(str.strip, text.splitlines())))
+    
+    def _find_section_offsets(self, text: str) -> Dict[str, int]:
+        """
+        Locate all section markers with a single scan of the text.
+        
+        Args:
+            text: Cleaned text from PDF
+            
+        Returns:
+            Dictionary mapping each marker found to its first offset
+        """
+        offsets = {}
+        for match in self.section_marker_pattern.finditer(text):
+            offsets.setdefault(match.group(0), match.start())
+        return offsets
     
     def _extract_course_info(self, text: str) -> CourseInfo:
         """
@@ -198,32 +301,17 @@ class CTECParser:
         if not text:
             raise CTECParsingError("Empty text provided for course info extraction")
         
-        # Try both patterns
-        match1 = self.course_pattern1.search(text)
-        match2 = self.course_pattern2.search(text)
-        
-        # Select the match that appears earlier
-        selected_match = None
-        pattern_used = None
-        
-        if match1 and match2:
-            selected_match = match1 if match1.start() <= match2.start() else match2
-            pattern_used = 1 if selected_match == match1 else 2
-        elif match1:
-            selected_match = match1
-            pattern_used = 1
-        elif match2:
-            selected_match = match2
-            pattern_used = 2
+        # A single search returns the earliest match of either format
+        selected_match = self.course_pattern.search(text)
         
         if not selected_match:
             raise CTECParsingError("Could not match course info pattern in text")
         
         try:
-            if pattern_used == 1:
-                title = selected_match.group(1).strip()
-                codes_part = selected_match.group(2).strip()
-                instructor = selected_match.group(3).strip()
+            if selected_match.group('instructor1') is not None:
+                title = selected_match.group('title1').strip()
+                codes_part = selected_match.group('codes1').strip()
+                instructor = selected_match.group('instructor1').strip()
                 
                 # Extract code and section
                 codes = [item.split(':')[0].strip() for item in codes_part.split(',') if ':' in item]
@@ -246,10 +334,10 @@ class CTECParser:
                     quarter="",  # Will be filled by _extract_term_info
                     year=0       # Will be filled by _extract_term_info
                 )
-            else:  # pattern_used == 2
-                code = selected_match.group(1).strip()
-                title = selected_match.group(2).strip()
-                instructor = selected_match.group(3).strip()
+            else:  # Format 2
+                code = selected_match.group('code2').strip()
+                title = selected_match.group('title2').strip()
+                instructor = selected_match.group('instructor2').strip()
                 
                 # Split by last underscore to separate course code from section
                 if '_' in code:
@@ -380,35 +468,31 @@ class CTECParser:
         
         lines = [line.strip() for line in comment_text.split('\n') if line.strip()]
         
-        # Group lines into comments (comments typically start with uppercase)
-        comments = []
-        current = []
-        
-        for line in lines:
-            if line and line[0].isupper() and current:
-                comments.append(' '.join(current))
-                current = [line]
-            else:
-                current.append(line)
-        
-        if current:
-            comments.append(' '.join(current))
+        # Group lines into comments (comments typically start with uppercase):
+        # find where each comment starts, then join each slice of lines once
+        starts = [i for i, line in enumerate(lines) if i == 0 or line[0].isupper()]
+        ends = starts[1:] + [len(lines)]
+        comments = [' '.join(lines[start:end]) for start, end in zip(starts, ends)]
         
         self._log_debug(f"Extracted {len(comments)} comments")
         return comments
     
-    def _extract_demographic_distributions(self, text: str) -> Dict[str, Dict]:
+    def _extract_demographic_distributions(self, text: str, section_offsets: Optional[Dict[str, int]] = None) -> Dict[str, Dict]:
         """
         Extract demographic distributions from text.
         
         Args:
             text: Cleaned text from PDF
+            section_offsets: Precomputed marker offsets from _find_section_offsets
             
         Returns:
             Dictionary with demographic distributions
         """
+        if section_offsets is None:
+            section_offsets = self._find_section_offsets(text)
+        
         # Find demographics section
-        start = text.find("DEMOGRAPHICS")
+        start = section_offsets.get("DEMOGRAPHICS", -1)
         if start == -1:
             return {}
         
@@ -421,47 +505,34 @@ class CTECParser:
         }
         
         # Extract distributions for each category
-        categories = [
-            (DEPARTMENTS, "What is the name of your school?"),
-            (CLASS_YEAR, "Your Class"),
-            (DISTRIBUTION_REQUIREMENT, "What is your reason for taking the course? (mark all that apply)"),
-            (PRIOR_INTEREST, "What was your Interest in this subject before taking the course?")
-        ]
-        
-        for items, category in categories:
-            for item in items:
-                pattern = rf"{re.escape(item)}\s+(\d+)\s+[\d.]+%"
-                match = re.search(pattern, demographics_text, flags=re.MULTILINE)
-                if match:
-                    key = item
-                    if category == "What was your Interest in this subject before taking the course?":
-                        if item == "1-Not interested at all":
-                            key = "1"
-                        elif item == "6-Extremely interested":
-                            key = "6"
-                        key = int(key) if key.isdigit() else key
-                    
-                    distributions[category][key] = int(match.group(1))
+        for category, key, pattern in self.demographic_patterns:
+            match = pattern.search(demographics_text)
+            if match:
+                distributions[category][key] = int(match.group(1))
         
         return distributions
     
-    def _extract_time_survey(self, text: str) -> Dict[str, Dict]:
+    def _extract_time_survey(self, text: str, section_offsets: Optional[Dict[str, int]] = None) -> Dict[str, Dict]:
         """
         Extract time survey distributions from text.
         
         Args:
             text: Cleaned text from PDF
+            section_offsets: Precomputed marker offsets from _find_section_offsets
             
         Returns:
             Dictionary with time survey distributions
         """
-        start = text.find("TIME-SURVEY QUESTION")
+        if section_offsets is None:
+            section_offsets = self._find_section_offsets(text)
+        
+        start = section_offsets.get("TIME-SURVEY QUESTION", -1)
         if start == -1:
             return {}
         
-        end = text.find("ESSAY QUESTIONS")
+        end = section_offsets.get("ESSAY QUESTIONS", -1)
         if end == -1:
-            end = text.find("Essay Questions")
+            end = section_offsets.get("Essay Questions", -1)
             if end == -1:
                 end = len(text)
         
@@ -503,14 +574,18 @@ class CTECParser:
         Raises:
             CTECParsingError: If OCR validation fails
         """
-        pairs = self.dist_pattern.findall(text)
-        distribution = {int(k): int(v) for k, v in pairs}
+        distribution = {}
+        ocr_total = None
+        for match in self.dist_pattern.finditer(text):
+            if match.group('total') is not None:
+                if ocr_total is None:
+                    ocr_total = int(match.group('total'))
+            else:
+                distribution[int(match.group('rating'))] = int(match.group('count'))
         
         # Validate against OCR total if enabled
         if self.config.validate_ocr_totals:
-            total_match = self.total_pattern.search(text)
-            if total_match:
-                ocr_total = int(total_match.group(1))
+            if ocr_total is not None:
                 calculated_total = sum(distribution.values())
                 
                 if ocr_total != calculated_total:
@@ -541,8 +616,7 @@ class CTECParser:
             Alternative distribution dictionary or None if no valid pattern found
         """
         # Alternative pattern 1: Numbers with different bracket styles
-        alt_pattern1 = re.compile(r"([1-6])[^\d]*?[\(\[\{](\d+)[\)\]\}]")
-        pairs1 = alt_pattern1.findall(text)
+        pairs1 = self.alt_dist_bracket_pattern.findall(text)
         if pairs1:
             distribution1 = {int(k): int(v) for k, v in pairs1 if k.isdigit() and v.isdigit()}
             if len(distribution1) >= 3:  # At least 3 ratings found
@@ -555,7 +629,7 @@ class CTECParser:
         distribution2 = {}
         for line in lines:
             # Look for patterns like "1 (5)" or "Very Low 3" etc.
-            match = re.search(r"(?:^|\s)([1-6])(?:\s*[-–—]\s*\w+)?\s*[\(\[]?(\d+)[\)\]]?", line.strip())
+            match = self.alt_dist_line_pattern.search(line.strip())
             if match:
                 rating, count = int(match.group(1)), int(match.group(2))
                 if 1 <= rating <= 6 and count < 1000:  # Sanity check
@@ -585,7 +659,7 @@ class CTECParser:
         validation_errors = []
         
         for question, pattern in self.survey_questions.items():
-            match = re.search(pattern, ocr_text, flags=re.S)
+            match = pattern.search(ocr_text)
             if match:
                 block = match.group(0)
                 try:
@@ -599,15 +673,15 @@ class CTECParser:
         
         return results
     
-    def _extract_ocr_from_page(self, page_img: Image.Image) -> str:
+    def _binarize_page(self, page_img: Image.Image) -> Image.Image:
         """
-        Extract OCR text from a page image.
+        Binarize a page image for document OCR.
         
         Args:
             page_img: PIL Image of the page
             
         Returns:
-            OCR text from the page
+            Single-channel black and white PIL Image of the page
         """
         img = np.array(page_img.convert("RGB"))
         gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
@@ -619,17 +693,42 @@ class CTECParser:
             cv2.THRESH_BINARY,
             31, 11
         )
-
-        # Biggest win: use document-style segmentation
-        config = "--oem 3 --psm 6 -c preserve_interword_spaces=1"
-        return pytesseract.image_to_string(bw, config=config)
+        return Image.fromarray(bw)
+    
+    def _extract_ocr_from_pages(self, page_imgs: List[Image.Image]) -> str:
+        """
+        Extract OCR text from binarized page images with a single Tesseract run.
+        
+        The pages are written as one multipage TIFF so Tesseract starts up and
+        loads its models once instead of once per page.
+        
+        Args:
+            page_imgs: Binarized PIL Images of the pages, in order
+            
+        Returns:
+            OCR text from all pages
+        """
+        # Biggest win: use document-style segmentation (uniform block of text)
+        # with the LSTM engine only, skipping the legacy engine entirely
+        config = "--oem 1 --psm 6 -c preserve_interword_spaces=1"
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tiff_path = os.path.join(tmp_dir, "pages.tif")
+            page_imgs[0].save(
+                tiff_path,
+                format="TIFF",
+                save_all=True,
+                append_images=page_imgs[1:]
+            )
+            return pytesseract.image_to_string(tiff_path, config=config)
         
-    def _extract_survey_ratings_via_ocr(self, pdf_path: str) -> Dict[str, Dict]:
+    def _extract_survey_ratings_via_ocr(self, pdf_bytes: bytes, pdf_path: str) -> Dict[str, Dict]:
         """
         Extract survey ratings (questions 1-5) using OCR on pages 2-3.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_bytes: Raw bytes of the PDF file
+            pdf_path: Path to the PDF file for error reporting
             
         Returns:
             Dictionary with rating distributions
@@ -638,19 +737,37 @@ class CTECParser:
             CTECParsingError: If OCR processing fails
         """
         try:
-            # Convert pages 2-3 to images (0-indexed: pages 1 and 2)
-            pages = convert_from_path(pdf_path, dpi=self.config.ocr_dpi)
-            if len(pages) < 3:
-                raise CTECParsingError(f"PDF has fewer than 3 pages: {len(pages)}")
-            
-            pages = pages[1:3]  # Pages 2-3
-            full_ocr_text = ""
+            # Rasterize only pages 2-3; the remaining pages are never OCR'd
+            pages = convert_from_bytes(
+                pdf_bytes,
+                dpi=self.config.ocr_dpi,
+                first_page=2,
+                last_page=3
+            )
+            binarized_pages = []
             
-            for i, page_img in enumerate(pages):
+            try:
+                if len(pages) < 2:
+                    raise CTECParsingError("PDF has fewer than 3 pages")
+                
+                for i, page_img in enumerate(pages):
+                    try:
+                        binarized_pages.append(self._binarize_page(page_img))
+                    except Exception as e:
+                        raise CTECParsingError(f"Image preprocessing failed on page {i + 2}: {e}")
+                    # Release the page's color pixel buffer as soon as it has been binarized
+                    page_img.close()
+                    pages[i] = None
+                
                 try:
-                    full_ocr_text += self._extract_ocr_from_page(page_img)
+                    full_ocr_text = self._extract_ocr_from_pages(binarized_pages)
                 except Exception as e:
-                    raise CTECParsingError(f"OCR failed on page {i + 2}: {e}")
+                    raise CTECParsingError(f"OCR failed on pages 2-3: {e}")
+            finally:
+                # Close whatever is still open, including pages left behind by a failure
+                for page_img in pages + binarized_pages:
+                    if page_img is not None:
+                        page_img.close()
             
             self._log_debug(f"OCR text extracted: {len(full_ocr_text)} characters")
             
@@ -661,6 +778,69 @@ class CTECParser:
                 raise
             raise CTECParsingError(f"Failed to extract survey ratings from {pdf_path}: {e}")
     
+    def _get_cache_path(self, pdf_bytes: bytes) -> Optional[str]:
+        """
+        Build the cache file path for a PDF from its content, the parser version
+        and the output-affecting config.
+        
+        Args:
+            pdf_bytes: Raw bytes of the PDF file
+            
+        Returns:
+            Path to the cache file, or None if caching is disabled
+        """
+        if not self.config.cache_dir:
+            return None
+        
+        digest = hashlib.blake2b(pdf_bytes, digest_size=16)
+        digest.update(repr((
+            PARSER_CACHE_VERSION,
+            self.config.ocr_dpi,
+            self.config.validate_ocr_totals,
+            self.config.extract_comments,
+            self.config.extract_demographics,
+            self.config.extract_time_survey
+        )).encode('utf-8'))
+        return os.path.join(self.config.cache_dir, f"{digest.hexdigest()}.json")
+    
+    def _load_cached_result(self, cache_path: str) -> Optional[CTECData]:
+        """
+        Load a previously cached parse result.
+        
+        Args:
+            cache_path: Path to the cache file
+            
+        Returns:
+            Cached CTECData, or None on a cache miss or unreadable entry
+        """
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return CTECData.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            self._log_debug(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+    
+    def _save_cached_result(self, cache_path: str, ctec_data: CTECData):
+        """
+        Write a parse result to the cache. Failures are logged and otherwise ignored.
+        
+        Args:
+            cache_path: Path to the cache file
+            ctec_data: Parse result to cache
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Per-process temp file so parallel parses of identical PDFs don't collide
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(ctec_data.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self._log_debug(f"Failed to write cache entry {cache_path}: {e}")
+    
     def parse_ctec(self, pdf_path: str) -> CTECData:
         """
         Parse a complete CTEC PDF file.
@@ -677,9 +857,21 @@ class CTECParser:
         self._log_debug(f"Starting to parse {pdf_path}")
         
         try:
+            # Read the file once; text extraction and OCR share the same bytes
+            pdf_bytes = self._read_pdf_bytes(pdf_path)
+            
+            # CTEC PDFs are immutable, so a cached result for identical bytes is reusable
+            cache_path = self._get_cache_path(pdf_bytes)
+            if cache_path:
+                cached = self._load_cached_result(cache_path)
+                if cached is not None:
+                    self._log_debug(f"Loaded cached parse result for {pdf_path}")
+                    return cached
+            
             # Extract text
-            raw_text = self._extract_text_from_pdf(pdf_path)
+            raw_text = self._extract_text_from_pdf(pdf_bytes, pdf_path)
             cleaned_text = self._clean_text(raw_text)
+            section_offsets = self._find_section_offsets(cleaned_text)
             
             # Extract course information
             course_info = self._extract_course_info(cleaned_text)
@@ -699,32 +891,40 @@ class CTECParser:
             survey_responses = {}
             
             # Questions 1-5 (OCR-based)
+            ocr_failed = False
             try:
-                rating_distributions = self._extract_survey_ratings_via_ocr(pdf_path)
+                rating_distributions = self._extract_survey_ratings_via_ocr(pdf_bytes, pdf_path)
                 survey_responses.update(rating_distributions)
             except CTECParsingError as e:
                 self._log_debug(f"Failed to extract rating distributions: {e}")
                 if not self.config.continue_on_ocr_errors:
                     raise
+                ocr_failed = True
             
             # Demographics (questions 6-10)
             if self.config.extract_demographics:
-                demographic_distributions = self._extract_demographic_distributions(cleaned_text)
+                demographic_distributions = self._extract_demographic_distributions(cleaned_text, section_offsets)
                 survey_responses.update(demographic_distributions)
             
             # Time survey (question 11)
             if self.config.extract_time_survey:
-                time_distributions = self._extract_time_survey(cleaned_text)
+                time_distributions = self._extract_time_survey(cleaned_text, section_offsets)
                 survey_responses.update(time_distributions)
             
             self._log_debug(f"Successfully parsed {pdf_path}")
             
-            return CTECData(
+            ctec_data = CTECData(
                 course_info=course_info,
                 comments=comments,
                 survey_responses=survey_responses
             )
             
+            # Don't cache partial results so OCR failures are retried on the next run
+            if cache_path and not ocr_failed:
+                self._save_cached_result(cache_path, ctec_data)
+            
+            return ctec_data
+            
         except Exception as e:
             if isinstance(e, CTECParsingError):
                 raise
@@ -5,12 +5,61 @@ This module contains legacy functions that have been superseded by the CTECParse
 For new code, use ctec_parser.CTECParser instead.
 """
 
+import logging
 import re
 import os
+from typing import Optional
 from pypdf import PdfReader
-from .ctec_parser import CTECParser
+from .ctec_parser import CTECParser, ParserConfig
 from .constants import DEPARTMENTS, CLASS_YEAR, DISTRIBUTION_REQUIREMENT, PRIOR_INTEREST, TIME_RANGES
 
+logger = logging.getLogger(__name__)
+
+def _compile_label_counts_pattern(labels: list) -> re.Pattern:
+    """Build one "<label> <count> <pct>%" alternation covering every label."""
+    alternation = "|".join(re.escape(label) for label in labels)
+    return re.compile(rf"({alternation})\s+(\d+)\s+[\d.]+%")
+
+def _extract_label_counts(pattern: re.Pattern, labels: list, text: str) -> dict:
+    """
+    Scan text once and return the first count found for each label.
+
+    Results are keyed in label order so the output matches a per-label search.
+    """
+    counts = {}
+    for match in pattern.finditer(text):
+        counts.setdefault(match.group(1), int(match.group(2)))
+    return {label: counts[label] for label in labels if label in counts}
+
+_DEPARTMENTS_PATTERN = _compile_label_counts_pattern(DEPARTMENTS)
+_CLASS_YEAR_PATTERN = _compile_label_counts_pattern(CLASS_YEAR)
+_DISTRIBUTION_REQUIREMENT_PATTERN = _compile_label_counts_pattern(DISTRIBUTION_REQUIREMENT)
+_PRIOR_INTEREST_PATTERN = _compile_label_counts_pattern(PRIOR_INTEREST)
+_TIME_RANGES_PATTERN = _compile_label_counts_pattern(TIME_RANGES)
+
+# Regex Pattern 1: Matches "TITLE (CODES_STRING) (INSTRUCTOR)" format
+# - No ^/$ anchors to allow matching anywhere within the cleaned text.
+# - (.*?): Non-greedy capture for Title and Codes String.
+# - \s*: Optional whitespace.
+# - ([^)]+): Captures Instructor name inside parentheses.
+_TITLE_CODES_PATTERN = re.compile(r"Student Report for (.*?)\((.*?)\)\s*\(([^)]+)\)")
+
+# Regex Pattern 2: Matches "CODE: TITLE (INSTRUCTOR)" format
+# - No ^/$ anchors.
+# - ([^:]+): Captures Code (anything not a colon).
+# - (.*?): Non-greedy capture for Title.
+# - \s*: Optional whitespace.
+# - ([^)]+): Captures Instructor name inside parentheses.
+_CODE_TITLE_PATTERN = re.compile(r"Student Report for ([^:]+):\s*(.*?)\s*\(([^)]+)\)")
+
+_TERM_PATTERN = re.compile(r"Course and Teacher Evaluations CTEC (Spring|Fall|Winter|Summer) (\d{4})")
+_COMMENTS_SECTION_PATTERN = re.compile(
+    re.escape("Please summarize your reaction to this course focusing on the aspects that were most important to you.")
+    + r"(?P<body>.*?)(?:DEMOGRAPHICS|\Z)",
+    re.DOTALL,
+)
+_STUDENT_REPORT_PATTERN = re.compile(r"Student Report for .*?\d+/\d+", re.DOTALL)
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Extracts text from all pages of a PDF file.
@@ -24,19 +73,19 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     """
     # check if the file exists
     if not os.path.exists(pdf_path):
-        print(f"Error: PDF file not found at {pdf_path}")
+        logger.error("PDF file not found at %s", pdf_path)
         return ""
 
     try:
         reader = PdfReader(pdf_path)
-        text = ""
+        pages = []
         for page in reader.pages:
             extracted = page.extract_text()
-            if extracted:  # Append text only if extraction was successful for the page
-                text += extracted + "\n" # Add newline between pages for clarity before cleaning
-        return text
+            if extracted:  # Keep text only if extraction was successful for the page
+                pages.append(extracted + "\n") # Add newline between pages for clarity before cleaning
+        return "".join(pages)
     except Exception as e:
-        print(f"Error reading or extracting text from {pdf_path}: {e}")
+        logger.error("Error reading or extracting text from %s: %s", pdf_path, e)
         return ""
 
 def clean_text(text: str) -> str:
@@ -57,7 +106,7 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     # Split, strip, filter empty lines, and join with spaces
-    return ' '.join(line.strip() for line in text.splitlines() if line.strip())
+    return ' '.join(filter(None, map(str.strip, text.splitlines())))
 
 def extract_code_title_instructor(text: str):
     """
@@ -78,29 +127,14 @@ def extract_code_title_instructor(text: str):
             "instructor": str
         }
     """
-    # Regex Pattern 1: Matches "TITLE (CODES_STRING) (INSTRUCTOR)" format
-    # - No ^/$ anchors to allow matching anywhere within the cleaned text.
-    # - (.*?): Non-greedy capture for Title and Codes String.
-    # - \s*: Optional whitespace.
-    # - ([^)]+): Captures Instructor name inside parentheses.
-    pattern1 = re.compile(r"Student Report for (.*?)\((.*?)\)\s*\(([^)]+)\)")
-
-    # Regex Pattern 2: Matches "CODE: TITLE (INSTRUCTOR)" format
-    # - No ^/$ anchors.
-    # - ([^:]+): Captures Code (anything not a colon).
-    # - (.*?): Non-greedy capture for Title.
-    # - \s*: Optional whitespace.
-    # - ([^)]+): Captures Instructor name inside parentheses.
-    pattern2 = re.compile(r"Student Report for ([^:]+):\s*(.*?)\s*\(([^)]+)\)")
-
     course_info = {}
     if not text:
-        print("Warning: Input text for extraction is empty.")
+        logger.warning("Input text for extraction is empty.")
         return None
 
     # Use re.search to find the first occurrence of either pattern
-    match1 = pattern1.search(text)
-    match2 = pattern2.search(text)
+    match1 = _TITLE_CODES_PATTERN.search(text)
+    match2 = _CODE_TITLE_PATTERN.search(text)
 
     selected_match = None
     pattern_used = 0 # 0 = None, 1 = Pattern1, 2 = Pattern2
@@ -136,7 +170,7 @@ def extract_code_title_instructor(text: str):
             course_info['section'] = code_and_section[1]
             course_info['instructor'] = instructor
         except IndexError:
-            print(f"Error processing groups for Pattern 1 match: {selected_match.groups()}")
+            logger.error("Error processing groups for Pattern 1 match: %s", selected_match.groups())
             return None
 
     elif selected_match and pattern_used == 2:
@@ -152,12 +186,12 @@ def extract_code_title_instructor(text: str):
             course_info['section'] = code_and_section[1]
             course_info['instructor'] = instructor
         except IndexError:
-            print(f"Error processing groups for Pattern 2 match: {selected_match.groups()}")
+            logger.error("Error processing groups for Pattern 2 match: %s", selected_match.groups())
             return None
 
     else:
         # No known pattern was found in the text
-        print("Info: Could not match known 'Student Report for...' patterns within the text.")
+        logger.info("Could not match known 'Student Report for...' patterns within the text.")
         return None # Return None if no pattern matched
 
     return course_info
@@ -179,7 +213,7 @@ def extract_quarter_and_year(text: str):
     if not text:
         return {}
 
-    match = re.search(r"Course and Teacher Evaluations CTEC (Spring|Fall|Winter|Summer) (\d{4})", text)
+    match = _TERM_PATTERN.search(text)
     if not match:
         return {}
 
@@ -203,39 +237,25 @@ def extract_comments(raw_text: str) -> list:
             ...
         ]
     """
-    # Find the comments section
-    if raw_text.find("Please summarize your reaction to this course focusing on the aspects that were most important to you.") == -1:
+    # Find the comments section: everything after the essay prompt up to DEMOGRAPHICS
+    match = _COMMENTS_SECTION_PATTERN.search(raw_text)
+    if not match:
         return []
-    start = (
-        raw_text.find("Please summarize your reaction to this course focusing on the aspects that were most important to you.") 
-        + len("Please summarize your reaction to this course focusing on the aspects that were most important to you.")
-    )
-    end = raw_text.find("DEMOGRAPHICS", start)
-    if end == -1:
-        end = len(raw_text)
 
     # Get the comments section and split into lines
-    comment_text = raw_text[start:end].strip()
+    comment_text = match.group("body").strip()
     comment_text = comment_text.replace("Comments", "")
-    comment_text = re.sub(r"Student Report for .*?\d+/\d+", "", comment_text, flags=re.DOTALL)
+    comment_text = _STUDENT_REPORT_PATTERN.sub("", comment_text)
 
     lines = [line.strip() for line in comment_text.split('\n') if line.strip()]
 
-    # Filter out unwanted sections and combine lines into comments
-    comments = []
-    current = []
+    # Group lines into comments (comments typically start with uppercase):
+    # find where each comment starts, then join each slice of lines once
+    starts = [i for i, line in enumerate(lines) if i == 0 or line[0].isupper()]
+    ends = starts[1:] + [len(lines)]
+    comments = [' '.join(lines[start:end]) for start, end in zip(starts, ends)]
 
-    for line in lines:
-        if line[0].isupper() and current:
-            comments.append(' '.join(current))
-            current = [line]
-        else:
-            current.append(line)
-
-    if current:
-        comments.append(' '.join(current))
-
-    print(comments)
+    logger.debug("Extracted %d comments: %s", len(comments), comments)
 
     return comments
 
@@ -267,36 +287,26 @@ def extract_demographics(text: str) -> dict:
         "prior_interest": {},
     }
 
-    for dept in DEPARTMENTS:
-        pattern = rf"{re.escape(dept)}\s+(\d+)\s+[\d.]+%"
-        match = re.search(pattern, demographics_text, flags=re.MULTILINE)
-        if match:
-            demographic_distributions["school_name"][dept] = int(match.group(1))
-
-    for year in CLASS_YEAR:
-        pattern = rf"{re.escape(year)}\s+(\d+)\s+[\d.]+%"
-        match = re.search(pattern, demographics_text, flags=re.MULTILINE)
-        if match:
-            demographic_distributions["class_year"][year] = int(match.group(1))
-
-    for requirement in DISTRIBUTION_REQUIREMENT:
-        pattern = rf"{re.escape(requirement)}\s+(\d+)\s+[\d.]+%"
-        match = re.search(pattern, demographics_text, flags=re.MULTILINE)
-        if match:
-            demographic_distributions["reason_for_taking_course"][requirement] = int(match.group(1))
-
-    for interest in PRIOR_INTEREST:
-        pattern = rf"{re.escape(interest)}\s+(\d+)\s+[\d.]+%"
-        match = re.search(pattern, demographics_text, flags=re.MULTILINE)
-        if match:
-            label = interest
-            if interest == "1-Not interested at all":
-                label = "1"
-            if interest == "6-Extremely interested":
-                label = "6"
-            label = int(label)
-
-            demographic_distributions["prior_interest"][label] = int(match.group(1))
+    demographic_distributions["school_name"] = _extract_label_counts(
+        _DEPARTMENTS_PATTERN, DEPARTMENTS, demographics_text
+    )
+    demographic_distributions["class_year"] = _extract_label_counts(
+        _CLASS_YEAR_PATTERN, CLASS_YEAR, demographics_text
+    )
+    demographic_distributions["reason_for_taking_course"] = _extract_label_counts(
+        _DISTRIBUTION_REQUIREMENT_PATTERN, DISTRIBUTION_REQUIREMENT, demographics_text
+    )
+
+    prior_interest = _extract_label_counts(_PRIOR_INTEREST_PATTERN, PRIOR_INTEREST, demographics_text)
+    for interest, count in prior_interest.items():
+        label = interest
+        if interest == "1-Not interested at all":
+            label = "1"
+        if interest == "6-Extremely interested":
+            label = "6"
+        label = int(label)
+
+        demographic_distributions["prior_interest"][label] = count
 
     return demographic_distributions
 
@@ -327,14 +337,12 @@ def extract_time_survey(text: str) -> dict:
 
     time_survey_text = text[start:end].strip()
 
-    for time_range in TIME_RANGES:
-        pattern = rf"{re.escape(time_range)}\s+(\d+)\s+[\d.]+%"
-        match = re.search(pattern, time_survey_text, flags=re.MULTILINE)
-        if match:
-            time_survey_distributions["time_survey"][time_range] = int(match.group(1))
+    time_survey_distributions["time_survey"] = _extract_label_counts(
+        _TIME_RANGES_PATTERN, TIME_RANGES, time_survey_text
+    )
     return time_survey_distributions
 
-def extract_all_info(pdf_path: str) -> dict:
+def extract_all_info(pdf_path: str, cache_dir: Optional[str] = None) -> dict:
     """
     DEPRECATED: Use CTECParser class instead.
     
@@ -343,10 +351,12 @@ def extract_all_info(pdf_path: str) -> dict:
 
     Args:
         pdf_path: The full path to the PDF file.
+        cache_dir: Optional directory for parse results keyed by the PDF's
+            content hash. Re-running on an unchanged PDF skips extraction.
 
     Returns:
         A dictionary containing course info, ratings, comments, term info, and distributions.
     """
-    parser = CTECParser()
+    parser = CTECParser(ParserConfig(cache_dir=cache_dir))
     ctec_data = parser.parse_ctec(pdf_path)
     return ctec_data.to_dict()
@@ -6,9 +6,10 @@ correct extraction of course information, ratings, demographics,
 comments, and time survey data.
 """
 
+import json
 from pathlib import Path
 import pytest
-from ctec_parser import CTECParser, CTECParsingError
+from ctec_parser import CTECParser, CTECParsingError, CTECData, CourseInfo
 
 
 class TestCTECParser:
@@ -124,6 +125,45 @@ class TestCTECParser:
             except Exception as e:
                 pytest.fail(f"Failed to extract term info: {e}")
 
+    def test_rating_distribution_extraction(self):
+        """Test rating counts and OCR total are read from one question block."""
+        ocr_block = (
+            "1. Provide an overall rating of the instruction\n"
+            "1-Very Low (0)\n2 (1)\n3 (4)\n4 (10)\n5 (30)\n"
+            "6-Very High (24)\n[ Total ] (69)\n"
+        )
+
+        distribution = self.parser._extract_rating_distribution_from_question(ocr_block)
+        assert distribution == {1: 0, 2: 1, 3: 4, 4: 10, 5: 30, 6: 24}
+
+        with pytest.raises(CTECParsingError):
+            self.parser._extract_rating_distribution_from_question(
+                ocr_block.replace("(69)", "(70)")
+            )
+
+    def test_ctec_data_json_round_trip(self):
+        """Test that from_dict restores integer option keys after a JSON round-trip."""
+        original = CTECData(
+            course_info=CourseInfo(
+                code="COMP_SCI 211-0-1",
+                title="Fundamentals of Computer Programming II",
+                section="1",
+                instructor="Jane Doe",
+                quarter="Fall",
+                year=2024,
+                audience_size=120,
+                response_count=69
+            ),
+            comments=["Great course.", "Too much homework."],
+            survey_responses={
+                "Provide an overall rating of the instruction": {1: 0, 2: 1, 3: 4, 4: 10, 5: 30, 6: 24},
+                "What is your school affiliation?": {"Weinberg": 40, "McCormick": 29}
+            }
+        )
+
+        restored = CTECData.from_dict(json.loads(json.dumps(original.to_dict())))
+        assert restored == original
+
     def test_demographic_extraction_coverage(self):
         """Test that demographic extraction covers expected categories."""
         # Test with a sample that has demographics
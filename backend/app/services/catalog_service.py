@@ -4,22 +4,41 @@ Catalog service - Business logic for course catalog operations.
 Orchestrates catalog scraping, validation, and database operations.
 """
 
+import sys
+from dataclasses import dataclass, field
 from typing import Dict, List, Set, Any
 from pathlib import Path
 
-from ..db.courses import get_courses_lookup, update_course_descriptions, get_courses_with_empty_catalog_data
+from ..db.courses import (
+    get_courses_lookup,
+    get_courses_catalog_text,
+    update_course_descriptions,
+    get_courses_with_empty_catalog_data
+)
 from ..db.requirements import (
     get_requirements_lookup, 
     upsert_requirements_from_names,
     update_course_requirements
 )
-from ..utils.file_helpers import load_json_file, save_json_file, confirm_operation
+from ..utils.file_helpers import load_json_file, save_json_array_streaming, confirm_operation
 from ..utils.logging import get_job_logger
 from ..settings import settings
-from ..supabase_client import supabase
 
+REQUIRED_CATALOG_FIELDS = ('course_code', 'description', 'prerequisites_text', 'requirements')
+_REQUIRED_CATALOG_FIELD_SET = frozenset(REQUIRED_CATALOG_FIELDS)
+
+
+@dataclass
+class CatalogUpdateBatches:
+    """Update payloads built from a single pass over catalog data."""
+    matched_data: List[Dict] = field(default_factory=list)
+    missing_courses: List[str] = field(default_factory=list)
+    course_updates: List[Dict] = field(default_factory=list)
+    unique_requirements: Set[str] = field(default_factory=set)
+    skipped_empty: int = 0
 
-def scrape_and_upload_catalog(dry_run: bool = False, department_filter: List[str] = None, limit_departments: int = None, empty_courses_only: bool = False) -> Dict:
+
+def scrape_and_upload_catalog(dry_run: bool = False, department_filter: List[str] = None, limit_departments: int = None, empty_courses_only: bool = False, max_workers: int = None) -> Dict:
     """
     Complete workflow: scrape course catalog and upload to database.
     
@@ -28,6 +47,7 @@ def scrape_and_upload_catalog(dry_run: bool = False, department_filter: List[str
         department_filter: Optional list of department codes to scrape
         limit_departments: Optional limit on number of departments
         empty_courses_only: If True, only update courses with completely empty catalog data
+        max_workers: Number of departments to scrape concurrently (defaults to settings.DEFAULT_MAX_WORKERS)
         
     Returns:
         Dictionary with operation results
@@ -41,7 +61,10 @@ def scrape_and_upload_catalog(dry_run: bool = False, department_filter: List[str
         
         # Scrape catalog
         logger.info("Scraping course catalog from Northwestern")
-        scraper = CatalogScraper(output_dir=str(settings.SCRAPED_DATA_DIR))
+        scraper = CatalogScraper(
+            max_workers=max_workers or settings.DEFAULT_MAX_WORKERS,
+            output_dir=str(settings.SCRAPED_DATA_DIR)
+        )
         scraped_data = scraper.scrape_all(
             limit_departments=limit_departments,
             department_filter=department_filter
@@ -62,14 +85,15 @@ def scrape_and_upload_catalog(dry_run: bool = False, department_filter: List[str
                 'course_code': course.course_code,
                 'description': course.description or '',
                 'prerequisites_text': course.prerequisites_text or '',
-                'requirements': course.requirements or []
+                # Requirement names repeat across most courses; share one string per name
+                'requirements': [sys.intern(name) for name in course.requirements or []]
             }
             for course in scraped_data.courses
         ]
         
         # Save backup
         backup_file = settings.SCRAPED_DATA_DIR / "catalog_data.json"
-        save_json_file(catalog_data, backup_file, "catalog backup")
+        save_json_array_streaming(catalog_data, backup_file, "catalog backup")
         
         # Upload to database
         if not dry_run:
@@ -114,63 +138,76 @@ def validate_catalog_data(catalog_data: List[Dict]) -> bool:
         print("❌ Invalid data: expected list of courses")
         return False
     
-    required_fields = ['course_code', 'description', 'prerequisites_text', 'requirements']
-    
-    for i, course in enumerate(catalog_data[:5]):  # Check first 5 courses
-        for field in required_fields:
-            if field not in course:
-                print(f"❌ Missing field '{field}' in course {i+1}")
-                return False
+    # Check every course, stopping at the first incomplete record
+    bad_index = next(
+        (
+            i for i, course in enumerate(catalog_data)
+            if not isinstance(course, dict) or not course.keys() >= _REQUIRED_CATALOG_FIELD_SET
+        ),
+        None
+    )
+    if bad_index is not None:
+        course = catalog_data[bad_index]
+        if not isinstance(course, dict):
+            print(f"❌ Invalid record in course {bad_index+1}: expected object")
+            return False
+        missing_field = next(f for f in REQUIRED_CATALOG_FIELDS if f not in course)
+        print(f"❌ Missing field '{missing_field}' in course {bad_index+1}")
+        return False
     
     print("✅ Data validation passed")
     return True
 
 
-def extract_unique_requirements(catalog_data: List[Dict]) -> Set[str]:
+def build_update_batches(catalog_data: List[Dict], courses_map: Dict[str, str], skip_empty_updates: bool = False) -> CatalogUpdateBatches:
     """
-    Extract all unique requirement names from catalog data.
+    Classify catalog data against existing courses and prepare updates in one pass.
     
-    Args:
-        catalog_data: List of course records
-        
-    Returns:
-        Set of unique requirement names
-    """
-    all_requirements = set()
-    for course in catalog_data:
-        all_requirements.update(course.get('requirements', []))
-    
-    # Remove empty strings
-    all_requirements.discard('')
-    return all_requirements
-
-
-def filter_to_existing_courses(catalog_data: List[Dict], courses_map: Dict[str, str]) -> Dict:
-    """
-    Filter catalog data to only courses that exist in database.
+    Course-requirement pairs are built separately by prepare_course_requirements,
+    since they need requirement IDs that only exist after the requirements upsert.
     
     Args:
         catalog_data: List of course records from catalog
         courses_map: Dictionary mapping course code to course id
+        skip_empty_updates: If True, don't emit updates whose description and
+            prerequisites are both empty (no-op writes when the target courses are empty)
         
     Returns:
-        Dictionary with matched and missing course data
+        CatalogUpdateBatches with matched data, missing codes, course updates,
+        and the unique requirement names of matched courses
     """
     logger = get_job_logger('catalog_filter')
-    logger.info("Filtering catalog data to existing courses only")
+    logger.info("Filtering catalog data to existing courses and preparing updates")
     
-    matched_courses = []
-    missing_courses = []
+    batches = CatalogUpdateBatches()
     
     for course_data in catalog_data:
         course_code = course_data['course_code']
+        course_id = courses_map.get(course_code)
+        
+        if course_id is None:
+            batches.missing_courses.append(course_code)
+            continue
         
-        if course_code in courses_map:
-            matched_courses.append(course_data)
+        batches.matched_data.append(course_data)
+        
+        if skip_empty_updates and not course_data['description'] and not course_data['prerequisites_text']:
+            batches.skipped_empty += 1
         else:
-            missing_courses.append(course_code)
+            # Prepare update record (ID + fields to update)
+            batches.course_updates.append({
+                'id': course_id,
+                'description': course_data['description'],
+                'prerequisites_text': course_data['prerequisites_text']
+            })
+        # Records loaded from JSON may carry a null requirements field
+        batches.unique_requirements.update(course_data.get('requirements') or ())
+    
+    # Remove empty strings
+    batches.unique_requirements.discard('')
     
-    logger.info(f"✅ {len(matched_courses)} courses found in database")
+    missing_courses = batches.missing_courses
+    logger.info(f"✅ {len(batches.matched_data)} courses found in database")
     logger.info(f"❌ {len(missing_courses)} courses NOT found (will be skipped)")
     
     if missing_courses:
@@ -180,43 +217,8 @@ def filter_to_existing_courses(catalog_data: List[Dict], courses_map: Dict[str,
         if len(missing_courses) > 10:
             logger.info(f"   ... and {len(missing_courses) - 10} more")
     
-    return {
-        'matched_data': matched_courses,
-        'missing_courses': missing_courses
-    }
-
-
-def prepare_course_updates(matched_data: List[Dict], courses_map: Dict[str, str]) -> List[Dict]:
-    """
-    Prepare course update records for batch update.
-    
-    Args:
-        matched_data: List of course data that matched existing courses
-        courses_map: Dictionary mapping course code to course id
-        
-    Returns:
-        List of update records with id and fields to update
-    """
-    logger = get_job_logger('catalog_prepare')
-    logger.info("Preparing course updates")
-    
-    course_updates = []
-    
-    for course_data in matched_data:
-        course_code = course_data['course_code']
-        course_id = courses_map[course_code]
-        
-        # Prepare update record (ID + fields to update)
-        update_record = {
-            'id': course_id,
-            'description': course_data['description'],
-            'prerequisites_text': course_data['prerequisites_text']
-        }
-        
-        course_updates.append(update_record)
-    
-    logger.info(f"✅ Prepared {len(course_updates)} course updates")
-    return course_updates
+    logger.info(f"✅ Prepared {len(batches.course_updates)} course updates")
+    return batches
 
 
 def prepare_course_requirements(matched_data: List[Dict], courses_map: Dict[str, str], requirements_map: Dict[str, str]) -> Dict:
@@ -234,7 +236,9 @@ def prepare_course_requirements(matched_data: List[Dict], courses_map: Dict[str,
     logger = get_job_logger('catalog_requirements')
     logger.info("Preparing course-requirements links")
     
-    course_requirement_pairs = []
+    # (course_id, requirement_id) tuples in first-seen order; duplicates collapse here
+    # instead of reaching the upsert, which rejects repeated conflict keys in one batch
+    pair_keys: Dict[tuple, None] = {}
     matched_course_ids = set()
     
     for course_data in matched_data:
@@ -242,15 +246,19 @@ def prepare_course_requirements(matched_data: List[Dict], courses_map: Dict[str,
         course_id = courses_map[course_code]  # Safe since data is already filtered
         matched_course_ids.add(course_id)
         
-        requirements = course_data.get('requirements', [])
+        requirements = course_data.get('requirements') or ()
         
         # Create pairs for each requirement
         for req_name in requirements:
-            if req_name and req_name in requirements_map:
-                course_requirement_pairs.append({
-                    'course_id': course_id,
-                    'requirement_id': requirements_map[req_name]
-                })
+            requirement_id = requirements_map.get(req_name)
+            if requirement_id is not None:
+                pair_keys[(course_id, requirement_id)] = None
+    
+    # Materialize dicts only for the Supabase payload
+    course_requirement_pairs = [
+        {'course_id': course_id, 'requirement_id': requirement_id}
+        for course_id, requirement_id in pair_keys
+    ]
     
     logger.info(f"✅ Created {len(course_requirement_pairs)} course-requirement links")
     logger.info(f"📚 Links for {len(matched_course_ids)} matched courses")
@@ -296,10 +304,13 @@ def update_course_catalog_data(catalog_data: List[Dict], dry_run: bool = False,
     
     requirements_map = get_requirements_lookup()
     
-    # Step 3: Filter to existing courses only
-    filter_results = filter_to_existing_courses(catalog_data, courses_map)
-    matched_data = filter_results['matched_data']
-    missing_courses = filter_results['missing_courses']
+    batch_size = settings.CATALOG_UPSERT_BATCH_SIZE
+    logger.info(f"Using upsert batch size {batch_size}")
+    
+    # Step 3: Filter to existing courses and prepare updates in one pass
+    batches = build_update_batches(catalog_data, courses_map, skip_empty_updates=empty_courses_only)
+    matched_data = batches.matched_data
+    missing_courses = batches.missing_courses
     
     if not matched_data:
         logger.error("No courses matched existing database records. Nothing to update.")
@@ -307,6 +318,8 @@ def update_course_catalog_data(catalog_data: List[Dict], dry_run: bool = False,
             'total_courses': len(catalog_data),
             'courses_matched': 0,
             'courses_updated': 0,
+            'courses_unchanged': 0,
+            'courses_skipped_empty': 0,
             'courses_missing': missing_courses,
             'requirements_found': 0,
             'requirements_linked': 0,
@@ -315,35 +328,41 @@ def update_course_catalog_data(catalog_data: List[Dict], dry_run: bool = False,
         }
     
     # Step 4: Upsert requirements for matched courses
-    unique_requirements = extract_unique_requirements(matched_data)
+    unique_requirements = batches.unique_requirements
     logger.info(f"📋 Found {len(unique_requirements)} unique requirements in matched courses")
     
     if not dry_run and unique_requirements:
-        req_results = upsert_requirements_from_names(unique_requirements)
+        req_results = upsert_requirements_from_names(unique_requirements, batch_size=batch_size)
         # Update lookup map with new requirements
         requirements_map.update(req_results.get('lookup_map', {}))
     else:
         logger.info("   [DRY RUN] Would upsert requirements")
     
-    # Step 5: Prepare and update courses (EXISTING ONLY)
-    course_updates = prepare_course_updates(matched_data, courses_map)
-    
-    # Validate that all course IDs in updates actually exist in database
-    if course_updates:
-        update_ids = [update['id'] for update in course_updates]
-        response = supabase.table('courses').select('id').in_('id', update_ids).execute()
-        existing_ids = {record['id'] for record in response.data}
-        
-        valid_updates = [u for u in course_updates if u['id'] in existing_ids]
-        skipped_count = len(course_updates) - len(valid_updates)
+    # Step 5: Update courses (EXISTING ONLY)
+    course_updates = batches.course_updates
+    
+    if batches.skipped_empty > 0:
+        logger.info(f"⏭️  Skipping {batches.skipped_empty} empty courses with no new catalog text")
+    
+    # Skip courses whose description and prerequisites already match the database,
+    # so steady-state re-scrapes don't rewrite every row. Courses selected in
+    # empty-only mode are known to be empty, so the builder already did this.
+    unchanged_count = 0
+    if course_updates and not empty_courses_only:
+        current_text = get_courses_catalog_text()
+        changed_updates = [
+            u for u in course_updates
+            if current_text.get(u['id']) != (u['description'] or '', u['prerequisites_text'] or '')
+        ]
+        unchanged_count = len(course_updates) - len(changed_updates)
         
-        if skipped_count > 0:
-            logger.warning(f"Skipped {skipped_count} course updates with invalid IDs")
+        if unchanged_count > 0:
+            logger.info(f"⏭️  Skipping {unchanged_count} courses with unchanged catalog text")
         
-        course_updates = valid_updates
+        course_updates = changed_updates
     
     if not dry_run and course_updates:
-        course_results = update_course_descriptions(course_updates)
+        course_results = update_course_descriptions(course_updates, batch_size=batch_size)
     else:
         if dry_run:
             logger.info(f"   [DRY RUN] Would update {len(course_updates)} existing courses")
@@ -355,7 +374,8 @@ def update_course_catalog_data(catalog_data: List[Dict], dry_run: bool = False,
     if not dry_run:
         requirements_results = update_course_requirements(
             req_prep['course_ids'], 
-            req_prep['pairs']
+            req_prep['pairs'],
+            batch_size=batch_size
         )
     else:
         logger.info(f"   [DRY RUN] Would link {len(req_prep['pairs'])} course-requirement pairs")
@@ -366,6 +386,8 @@ def update_course_catalog_data(catalog_data: List[Dict], dry_run: bool = False,
         'total_courses': len(catalog_data),
         'courses_matched': len(matched_data),
         'courses_updated': course_results.get('updated', 0),
+        'courses_unchanged': unchanged_count,
+        'courses_skipped_empty': batches.skipped_empty,
         'courses_missing': missing_courses,
         'requirements_found': len(unique_requirements),
         'requirements_linked': requirements_results.get('linked', 0),
@@ -5,9 +5,15 @@ Orchestrates CTEC processing, validation, and database operations.
 """
 
 import hashlib
+import logging
+import os
+import time
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Callable, Dict, Any, List, Literal, Optional
+from datetime import datetime, timedelta
 
 from ..parsing.ctec.ctec_parser import CTECParser, ParserConfig, CTECData
 from ..db.courses import get_courses_lookup, create_course
@@ -21,15 +27,145 @@ from ..db.ctecs import (
     upsert_ratings,
     upsert_rating_distributions,
     get_instructors_lookup,
+    get_instructor_by_name,
     get_survey_questions_lookup,
     get_ratings_by_offering,
-    get_survey_question_options
+    get_survey_question_options_bulk
 )
-from ..utils.file_helpers import find_pdf_files, confirm_operation
+from ..utils.file_helpers import find_pdf_files, confirm_operation, write_json_line
 from ..utils.logging import get_job_logger
+from ..utils.lookup_cache import get_cached_lookup
 
 
-def parse_and_upload_ctec(pdf_path: Path, dry_run: bool = False, parser_config: Optional[ParserConfig] = None) -> Dict:
+def get_cached_survey_questions_lookup() -> Dict[str, str]:
+    """
+    Get the survey question lookup (question -> id), cached per TTL.
+    
+    Returns:
+        Dictionary mapping question text to question id
+    """
+    return get_cached_lookup('survey_questions', get_survey_questions_lookup)
+
+
+@dataclass
+class CTECUploadContext:
+    """Lookups shared by every CTEC uploaded in one batch."""
+    courses_lookup: Dict[str, str] = field(default_factory=dict)
+    instructors_lookup: Dict[str, str] = field(default_factory=dict)
+    questions_lookup: Dict[str, str] = field(default_factory=dict)
+    option_lookups: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
+def fetch_option_lookups(question_ids: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch survey question options in one query and index them by label.
+    
+    Args:
+        question_ids: UUIDs of the survey questions
+        
+    Returns:
+        Dictionary mapping question id to {option label: option id}
+    """
+    options_by_question = get_survey_question_options_bulk(question_ids)
+    return {
+        question_id: {option['label']: option['id'] for option in options}
+        for question_id, options in options_by_question.items()
+    }
+
+
+def build_upload_context() -> CTECUploadContext:
+    """
+    Fetch the course, instructor, survey question and option lookups once.
+    
+    Survey questions come from a short-lived in-process cache. Options are
+    fetched fresh for the current questions, so they always match them, and
+    courses and instructors are always read fresh since uploads add to them.
+    
+    Returns:
+        CTECUploadContext populated from the database
+    """
+    questions_lookup = get_cached_survey_questions_lookup()
+    option_lookups = fetch_option_lookups(list(questions_lookup.values()))
+    
+    return CTECUploadContext(
+        courses_lookup=get_courses_lookup(),
+        instructors_lookup=get_instructors_lookup(),
+        questions_lookup=questions_lookup,
+        option_lookups=option_lookups
+    )
+
+
+def parse_ctec_file(pdf_path: Path, parser_config: Optional[ParserConfig] = None) -> CTECData:
+    """
+    Parse a single CTEC PDF without touching the database.
+    
+    Kept at module level so batch processing can run it in worker processes.
+    
+    Args:
+        pdf_path: Path to CTEC PDF file
+        parser_config: Optional parser configuration
+        
+    Returns:
+        Parsed CTEC data
+    """
+    if parser_config is None:
+        parser_config = ParserConfig(
+            debug=False,
+            validate_ocr_totals=False,
+            continue_on_ocr_errors=True,
+            extract_comments=True,
+            extract_demographics=True,
+            extract_time_survey=True
+        )
+    
+    parser = CTECParser(parser_config)
+    return parser.parse_ctec(str(pdf_path))
+
+
+def upload_parsed_ctec(pdf_path: Path, ctec_data: CTECData, dry_run: bool = False, context: Optional[CTECUploadContext] = None) -> Dict:
+    """
+    Upload an already parsed CTEC and build the per-file result.
+    
+    Args:
+        pdf_path: Path to the CTEC PDF the data was parsed from
+        ctec_data: Parsed CTEC data
+        dry_run: If True, preview changes without applying
+        context: Optional lookups shared across a batch (fetched if not provided)
+        
+    Returns:
+        Dictionary with parse and upload results
+    """
+    logger = get_job_logger('upload_ctec')
+    
+    if not dry_run:
+        upload_results = upload_ctec_data(ctec_data, pdf_path.name, context)
+    else:
+        logger.info("[DRY RUN] Would upload CTEC data")
+        upload_results = {
+            'uploaded': True,
+            'course_offering_id': 'dry-run-id',
+            'comments_uploaded': len(ctec_data.comments),
+            'ratings_uploaded': len(ctec_data.survey_responses),
+            'errors': []
+        }
+    
+    course_info = ctec_data.course_info
+    return {
+        'status': 'success',
+        'file': pdf_path.name,
+        'course_info': {
+            'code': course_info.code,
+            'title': course_info.title,
+            'instructor': course_info.instructor,
+            'quarter': course_info.quarter,
+            'year': course_info.year,
+            'section': course_info.section
+        },
+        'upload_results': upload_results
+    }
+
+
+def parse_and_upload_ctec(pdf_path: Path, dry_run: bool = False, parser_config: Optional[ParserConfig] = None, context: Optional[CTECUploadContext] = None) -> Dict:
     """
     Parse a single CTEC PDF and upload to database.
     
@@ -37,6 +173,7 @@ def parse_and_upload_ctec(pdf_path: Path, dry_run: bool = False, parser_config:
         pdf_path: Path to CTEC PDF file
         dry_run: If True, preview changes without applying
         parser_config: Optional parser configuration
+        context: Optional lookups shared across a batch (fetched if not provided)
         
     Returns:
         Dictionary with parse and upload results
@@ -51,52 +188,15 @@ def parse_and_upload_ctec(pdf_path: Path, dry_run: bool = False, parser_config:
     
     try:
         # Parse CTEC
-        logger.info(f"Parsing CTEC: {pdf_path.name}")
-        
-        if parser_config is None:
-            parser_config = ParserConfig(
-                debug=False,
-                validate_ocr_totals=False,
-                continue_on_ocr_errors=True,
-                extract_comments=True,
-                extract_demographics=True,
-                extract_time_survey=True
-            )
-        
-        parser = CTECParser(parser_config)
-        ctec_data = parser.parse_ctec(str(pdf_path))
-        
-        logger.info(f"Successfully parsed CTEC for {ctec_data.course_info.code}")
+        logger.info("Parsing CTEC: %s", pdf_path.name)
+        ctec_data = parse_ctec_file(pdf_path, parser_config)
+        logger.info("Successfully parsed CTEC for %s", ctec_data.course_info.code)
         
         # Upload to database
-        if not dry_run:
-            upload_results = upload_ctec_data(ctec_data, pdf_path.name)
-        else:
-            logger.info("[DRY RUN] Would upload CTEC data")
-            upload_results = {
-                'uploaded': True,
-                'course_offering_id': 'dry-run-id',
-                'comments_uploaded': len(ctec_data.comments),
-                'ratings_uploaded': len(ctec_data.survey_responses),
-                'errors': []
-            }
-        
-        return {
-            'status': 'success',
-            'file': pdf_path.name,
-            'course_info': {
-                'code': ctec_data.course_info.code,
-                'title': ctec_data.course_info.title,
-                'instructor': ctec_data.course_info.instructor,
-                'quarter': ctec_data.course_info.quarter,
-                'year': ctec_data.course_info.year,
-                'section': ctec_data.course_info.section
-            },
-            'upload_results': upload_results
-        }
+        return upload_parsed_ctec(pdf_path, ctec_data, dry_run, context)
         
     except Exception as e:
-        logger.error(f"Failed to process {pdf_path.name}: {e}")
+        logger.error("Failed to process %s: %s", pdf_path.name, e)
         return {
             'status': 'error',
             'file': pdf_path.name,
@@ -104,7 +204,7 @@ def parse_and_upload_ctec(pdf_path: Path, dry_run: bool = False, parser_config:
         }
 
 
-def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
+def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "", context: Optional[CTECUploadContext] = None) -> Dict:
     """
     Upload parsed CTEC data to database using the "replace snapshot" model.
     
@@ -118,6 +218,7 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
     Args:
         ctec_data: Parsed CTEC data
         file_identifier: File name for error reporting
+        context: Optional lookups shared across a batch (fetched if not provided)
         
     Returns:
         Dictionary with upload results
@@ -125,13 +226,15 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
     logger = get_job_logger('upload_ctec_data')
     
     try:
+        if context is None:
+            context = build_upload_context()
+        
         # Step 1: Get or create course (idempotent)
-        course_lookup = get_courses_lookup()
-        course_id = course_lookup.get(ctec_data.course_info.code)
+        course_id = context.courses_lookup.get(ctec_data.course_info.code)
         
         if not course_id:
             # Course doesn't exist - create it from CTEC data
-            logger.info(f"Course {ctec_data.course_info.code} not found in database, creating new course record")
+            logger.info("Course %s not found in database, creating new course record", ctec_data.course_info.code)
             
             created_course = create_course(
                 code=ctec_data.course_info.code,
@@ -145,17 +248,25 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
                 }
             
             course_id = created_course['id']
-            logger.info(f"Successfully created course record: {ctec_data.course_info.code} (ID: {course_id})")
+            context.courses_lookup[ctec_data.course_info.code] = course_id
+            logger.info("Successfully created course record: %s (ID: %s)", ctec_data.course_info.code, course_id)
         
-        # Step 2: Upsert instructor (idempotent)
-        instructor_data = [{'name': ctec_data.course_info.instructor}]
-        instructor_results = upsert_instructors(instructor_data)
+        # Step 2: Upsert instructor (idempotent, skipped if already known)
+        instructor_name = ctec_data.course_info.instructor
+        instructor_id = context.instructors_lookup.get(instructor_name)
         
-        if instructor_results['errors']:
-            return {'error': f'Failed to upsert instructor: {instructor_results["errors"]}'}
-        
-        instructor_lookup = get_instructors_lookup()
-        instructor_id = instructor_lookup[ctec_data.course_info.instructor]
+        if not instructor_id:
+            instructor_results = upsert_instructors([{'name': instructor_name}])
+            
+            if instructor_results['errors']:
+                return {'error': f'Failed to upsert instructor: {instructor_results["errors"]}'}
+            
+            instructor = get_instructor_by_name(instructor_name)
+            if not instructor:
+                return {'error': f'Failed to look up instructor {instructor_name}'}
+            
+            instructor_id = instructor['id']
+            context.instructors_lookup[instructor_name] = instructor_id
         
         # Step 3: Upsert course offering and get ID reliably (no race conditions)
         offering_data = {
@@ -174,7 +285,7 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
             return {'error': 'Failed to upsert course offering'}
         
         # Step 4: SNAPSHOT REPLACEMENT - Clear existing offering data
-        logger.info(f"Clearing existing snapshot data for offering {course_offering_id}")
+        logger.info("Clearing existing snapshot data for offering %s", course_offering_id)
         clear_results = clear_offering_snapshot_data(course_offering_id)
         
         if clear_results['errors']:
@@ -183,19 +294,20 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
         # Step 5: Insert fresh comments (data was cleared, so clean insertion should work)
         comments_inserted = 0
         if ctec_data.comments:
-            # Deduplicate comments by content_hash to handle duplicate content in CTEC
-            unique_comments = {}
-            for comment in ctec_data.comments:
-                content_hash = hashlib.sha256(comment.encode('utf-8')).hexdigest()
-                unique_comments[content_hash] = {
+            # Deduplicate comments on their text (order-preserving), then hash only the survivors
+            unique_comments = dict.fromkeys(ctec_data.comments)
+            sha256 = hashlib.sha256
+            comment_data = [
+                {
                     'course_offering_id': course_offering_id,
                     'content': comment,
-                    'content_hash': content_hash
+                    'content_hash': sha256(comment.encode('utf-8')).hexdigest()
                 }
+                for comment in unique_comments
+            ]
             
-            comment_data = list(unique_comments.values())
             if len(comment_data) < len(ctec_data.comments):
-                logger.info(f"Deduplicated {len(ctec_data.comments)} comments to {len(comment_data)} unique comments")
+                logger.info("Deduplicated %d comments to %d unique comments", len(ctec_data.comments), len(comment_data))
             
             comment_results = insert_comments(comment_data)
             comments_inserted = comment_results.get('inserted', 0)
@@ -208,10 +320,11 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
         if ctec_data.survey_responses:
             ratings_inserted = insert_survey_responses(
                 course_offering_id, 
-                ctec_data.survey_responses
+                ctec_data.survey_responses,
+                context
             )
         
-        logger.info(f"Successfully uploaded CTEC snapshot: {comments_inserted} comments, {ratings_inserted} ratings")
+        logger.info("Successfully uploaded CTEC snapshot: %d comments, %d ratings", comments_inserted, ratings_inserted)
         
         return {
             'uploaded': True,
@@ -226,70 +339,68 @@ def upload_ctec_data(ctec_data: CTECData, file_identifier: str = "") -> Dict:
         }
         
     except Exception as e:
-        logger.error(f"Failed to upload CTEC data for {file_identifier}: {e}")
+        logger.error("Failed to upload CTEC data for %s: %s", file_identifier, e)
         return {'error': str(e)}
 
 
-def upload_survey_responses(course_offering_id: str, survey_responses: Dict[str, Any]) -> int:
-    """
-    Upload survey questions, ratings, and rating distributions for a course offering.
-    
-    Args:
-        course_offering_id: UUID of the course offering
-        survey_responses: Dictionary of survey responses with distributions
-        
-    Returns:
-        Number of ratings uploaded
-    """
-    logger = get_job_logger('upload_survey')
-    
-    # Step 1: Get question lookup (questions should already exist from setup)
-    questions_lookup = get_survey_questions_lookup()
-    
-    # Step 2: Create ratings for each question using mapped names
-    rating_data = []
-    for question_key, _ in survey_responses.items():
-        
-        if question_key in questions_lookup:
-            question_id = questions_lookup[question_key]
-            rating_data.append({
-                'course_offering_id': course_offering_id,
-                'survey_question_id': question_id
-            })
-        else:
-            logger.warning(f"Question not found after mapping: {question_key}")
-    
-    # Step 3: Upload ratings (this creates the rating records)
-    ratings_uploaded = 0
-    if rating_data:
-        rating_results = upsert_ratings(rating_data)
-        ratings_uploaded = rating_results.get('uploaded', 0)
-    
-    # Step 4: Upload rating distributions (the actual vote counts)
-    if ratings_uploaded > 0:
-        upload_rating_distributions(course_offering_id, survey_responses, questions_lookup)
-    
-    return ratings_uploaded
+@dataclass(frozen=True)
+class _SurveyWriter:
+    """Database writers and error handling for one survey write mode."""
+    write_ratings: Callable[[List[Dict]], Dict]
+    write_distributions: Callable[[List[Dict]], Dict]
+    count_key: str  # Result key each writer reports its count under
+    abort_on_rating_errors: bool  # Skip distributions if any ratings batch failed
+    survey_logger: str
+    distributions_logger: str
+    distribution_error_level: int
+
+
+_SURVEY_WRITERS = {
+    # Snapshot replacement: a partial ratings write leaves nothing consistent to attach to
+    'insert': _SurveyWriter(
+        insert_ratings, insert_rating_distributions, 'inserted',
+        abort_on_rating_errors=True,
+        survey_logger='insert_survey',
+        distributions_logger='insert_distributions',
+        distribution_error_level=logging.ERROR
+    ),
+    # Merge: distributions still go to the ratings that were written
+    'upsert': _SurveyWriter(
+        upsert_ratings, upsert_rating_distributions, 'uploaded',
+        abort_on_rating_errors=False,
+        survey_logger='upload_survey',
+        distributions_logger='upload_distributions',
+        distribution_error_level=logging.WARNING
+    ),
+}
 
 
-def insert_survey_responses(course_offering_id: str, survey_responses: Dict[str, Any]) -> int:
+def write_survey_responses(course_offering_id: str, survey_responses: Dict[str, Any], context: Optional[CTECUploadContext] = None, mode: Literal['insert', 'upsert'] = 'insert') -> int:
     """
-    Insert survey ratings and distributions for a course offering (snapshot replacement).
+    Write survey ratings and rating distributions for a course offering.
     
-    Used in the "replace snapshot" model where ratings are pre-cleared and we need
-    clean insertion without upsert logic.
+    In 'insert' mode (the "replace snapshot" model) ratings are pre-cleared and
+    written without conflict resolution; 'upsert' mode merges with existing rows.
     
     Args:
         course_offering_id: UUID of the course offering
         survey_responses: Dictionary of survey responses with distributions
+        context: Optional lookups shared across a batch
+        mode: 'insert' or 'upsert'
         
     Returns:
-        Number of ratings inserted
+        Number of ratings written
     """
-    logger = get_job_logger('insert_survey')
+    writer = _SURVEY_WRITERS[mode]
+    logger = get_job_logger(writer.survey_logger)
     
     # Step 1: Get question lookup (questions should already exist from setup)
-    questions_lookup = get_survey_questions_lookup()
+    if context is not None:
+        questions_lookup = context.questions_lookup
+        option_lookups = context.option_lookups
+    else:
+        questions_lookup = get_cached_survey_questions_lookup()
+        option_lookups = None
     
     # Step 2: Create ratings for each question
     rating_data = []
@@ -302,192 +413,160 @@ def insert_survey_responses(course_offering_id: str, survey_responses: Dict[str,
                 'survey_question_id': question_id
             })
         else:
-            logger.warning(f"Question not found after mapping: {question_key}")
+            logger.warning("Question not found after mapping: %s", question_key)
     
-    # Step 3: Insert ratings (this creates the rating records)
-    ratings_inserted = 0
+    # Step 3: Write ratings (this creates the rating records)
+    ratings_written = 0
     if rating_data:
-        rating_results = insert_ratings(rating_data)
-        ratings_inserted = rating_results.get('inserted', 0)
+        rating_results = writer.write_ratings(rating_data)
+        ratings_written = rating_results.get(writer.count_key, 0)
         
         if rating_results['errors']:
-            logger.error(f"Failed to insert ratings: {rating_results['errors']}")
-            return 0
-    
-    # Step 4: Insert rating distributions (the actual vote counts)
-    if ratings_inserted > 0:
-        insert_rating_distributions_for_offering(course_offering_id, survey_responses, questions_lookup)
-    
-    return ratings_inserted
+            logger.error("Failed to %s ratings: %s", mode, rating_results['errors'])
+            if writer.abort_on_rating_errors:
+                return 0
+    
+    # Step 4: Write rating distributions (the actual vote counts)
+    if ratings_written > 0:
+        write_rating_distributions(
+            course_offering_id,
+            survey_responses,
+            questions_lookup,
+            option_lookups,
+            ratings=rating_results.get('ratings'),
+            mode=mode
+        )
+    
+    return ratings_written
 
 
-def upload_rating_distributions(course_offering_id: str, survey_responses: Dict[str, Any], questions_lookup: Dict[str, str]) -> None:
+def write_rating_distributions(course_offering_id: str, survey_responses: Dict[str, Any], questions_lookup: Dict[str, str], option_lookups: Optional[Dict[str, Dict[str, str]]] = None, ratings: Optional[List[Dict]] = None, mode: Literal['insert', 'upsert'] = 'insert') -> None:
     """
-    Upload rating distributions (vote counts) for survey responses.
+    Write rating distributions (vote counts) for survey responses.
+    
+    In 'insert' mode rating distributions are expected to be pre-cleared via
+    cascade delete when ratings are deleted.
     
     Args:
         course_offering_id: UUID of the course offering
         survey_responses: Dictionary of survey responses with distributions
         questions_lookup: Dictionary mapping question text to question IDs
+        option_lookups: Optional prefetched {label: option id} maps keyed by question ID
+        ratings: Optional rating rows returned by the ratings write (queried if not provided)
+        mode: 'insert' or 'upsert'
     """
-    logger = get_job_logger('upload_distributions')
+    writer = _SURVEY_WRITERS[mode]
+    logger = get_job_logger(writer.distributions_logger)
     
-    # Get all ratings for this course offering
-    ratings = get_ratings_by_offering(course_offering_id)
-    rating_lookup = {
-        (rating['course_offering_id'], rating['survey_question_id']): rating['id']
-        for rating in ratings
-    }
+    # Nothing to write (and no lookups to make) if no response maps to a known question
+    question_ids = [questions_lookup[q] for q in survey_responses if q in questions_lookup]
+    if not question_ids:
+        logger.warning("No survey responses matched known questions - skipping distributions")
+        return
+    
+    # Use the rows returned by the ratings write; only query them back if unavailable
+    if not ratings:
+        ratings = get_ratings_by_offering(course_offering_id)
+    # Every rating belongs to this offering, so key by question alone
+    rating_lookup = {rating['survey_question_id']: rating['id'] for rating in ratings}
+    
+    # Fetch options for every matched question in one query unless prefetched
+    if option_lookups is None:
+        option_lookups = fetch_option_lookups(question_ids)
     
     distribution_data = []
     
     for question, response_data in survey_responses.items():
         
         if question not in questions_lookup:
-            logger.warning(f"Question not found in lookup: {question}")
+            logger.warning("Question not found in lookup: %s", question)
             continue
             
         question_id = questions_lookup[question]
-        rating_key = (course_offering_id, question_id)
+        rating_id = rating_lookup.get(question_id)
         
-        if rating_key not in rating_lookup:
-            logger.warning(f"No rating found for question: {question}")
+        if rating_id is None:
+            logger.warning("No rating found for question: %s", question)
             continue
             
-        rating_id = rating_lookup[rating_key]
         
-        # Get survey question options for this question
-        options = get_survey_question_options(question_id)
-        if not options:
-            logger.warning(f"No options found for question: {question}")
+        # Get option lookup for this question: always match by label
+        option_lookup = option_lookups.get(question_id)
+        if not option_lookup:
+            logger.warning("No options found for question: %s", question)
             continue
             
-        # Create option lookup: always match by label
-        option_lookup = {option['label']: option['id'] for option in options}
-        logger.debug(f"Question: {question[:50]}... using label matching with {len(option_lookup)} options")
+        logger.debug("Question: %.50s... using label matching with %d options", question, len(option_lookup))
         
         # Handle distribution data
         if isinstance(response_data, dict):
+            get_option_id = option_lookup.get
+            
             # Match each response key to options
             for response_key, count in response_data.items():
-                # Convert response key to string to match option labels
-                response_key_str = str(response_key)
-                if response_key_str in option_lookup:
+                # Option labels are strings; parsed keys normally already are
+                option_id = get_option_id(response_key if isinstance(response_key, str) else str(response_key))
+                if option_id is not None:
                     distribution_data.append({
                         'rating_id': rating_id,
-                        'option_id': option_lookup[response_key_str],
+                        'option_id': option_id,
                         'count': count  # Include zero counts
                     })
-                    logger.debug(f"Matched '{response_key}' -> count: {count}")
+                    logger.debug("Matched '%s' -> count: %s", response_key, count)
                 else:
-                    logger.warning(f"No option found for response key '{response_key}' in question: {question[:30]}...")
-                    logger.debug(f"Available options: {list(option_lookup.keys())}")
+                    logger.warning("No option found for response key '%s' in question: %.30s...", response_key, question)
+                    logger.debug("Available options: %s", list(option_lookup))
         else:
-            logger.warning(f"Unexpected response format for {question}: {type(response_data)}")
+            logger.warning("Unexpected response format for %s: %s", question, type(response_data))
     
-    # Upload distribution data
+    # Write distribution data
     if distribution_data:
-        distribution_results = upsert_rating_distributions(distribution_data)
-        logger.info(f"Uploaded {distribution_results.get('uploaded', 0)} rating distributions")
+        distribution_results = writer.write_distributions(distribution_data)
+        logger.info("Wrote %d rating distributions (%s)", distribution_results.get(writer.count_key, 0), mode)
         
         if distribution_results.get('errors'):
-            logger.warning(f"Distribution upload errors: {distribution_results['errors']}")
+            logger.log(writer.distribution_error_level, "Distribution %s errors: %s", mode, distribution_results['errors'])
     else:
-        logger.warning("No distribution data to upload - check option matching")
+        logger.warning("No distribution data to %s - check option matching", mode)
 
 
-def insert_rating_distributions_for_offering(course_offering_id: str, survey_responses: Dict[str, Any], questions_lookup: Dict[str, str]) -> None:
+def insert_survey_responses(course_offering_id: str, survey_responses: Dict[str, Any], context: Optional[CTECUploadContext] = None) -> int:
     """
-    Insert rating distributions (vote counts) for survey responses (snapshot replacement).
-    
-    Used in the "replace snapshot" model where rating distributions are pre-cleared
-    via cascade delete when ratings are deleted.
+    Insert survey ratings and distributions for a course offering (snapshot replacement).
     
     Args:
         course_offering_id: UUID of the course offering
         survey_responses: Dictionary of survey responses with distributions
-        questions_lookup: Dictionary mapping question text to question IDs
-    """
-    logger = get_job_logger('insert_distributions')
-    
-    # Get all ratings for this course offering (should be freshly inserted)
-    ratings = get_ratings_by_offering(course_offering_id)
-    rating_lookup = {
-        (rating['course_offering_id'], rating['survey_question_id']): rating['id']
-        for rating in ratings
-    }
-    
-    distribution_data = []
-    
-    for question, response_data in survey_responses.items():
-        
-        if question not in questions_lookup:
-            logger.warning(f"Question not found in lookup: {question}")
-            continue
-            
-        question_id = questions_lookup[question]
-        rating_key = (course_offering_id, question_id)
+        context: Optional lookups shared across a batch
         
-        if rating_key not in rating_lookup:
-            logger.warning(f"No rating found for question: {question}")
-            continue
-            
-        rating_id = rating_lookup[rating_key]
-        
-        # Get survey question options for this question
-        options = get_survey_question_options(question_id)
-        if not options:
-            logger.warning(f"No options found for question: {question}")
-            continue
-            
-        # Create option lookup: always match by label
-        option_lookup = {option['label']: option['id'] for option in options}
-        logger.debug(f"Question: {question[:50]}... using label matching with {len(option_lookup)} options")
-        
-        # Handle distribution data
-        if isinstance(response_data, dict):
-            # Match each response key to options
-            for response_key, count in response_data.items():
-                # Convert response key to string to match option labels
-                response_key_str = str(response_key)
-                if response_key_str in option_lookup:
-                    distribution_data.append({
-                        'rating_id': rating_id,
-                        'option_id': option_lookup[response_key_str],
-                        'count': count  # Include zero counts
-                    })
-                    logger.debug(f"Matched '{response_key}' -> count: {count}")
-                else:
-                    logger.warning(f"No option found for response key '{response_key}' in question: {question[:30]}...")
-                    logger.debug(f"Available options: {list(option_lookup.keys())}")
-        else:
-            logger.warning(f"Unexpected response format for {question}: {type(response_data)}")
-    
-    # Insert distribution data (clean insertion - no upsert needed)
-    if distribution_data:
-        distribution_results = insert_rating_distributions(distribution_data)
-        logger.info(f"Inserted {distribution_results.get('inserted', 0)} rating distributions")
-        
-        if distribution_results.get('errors'):
-            logger.error(f"Distribution insertion errors: {distribution_results['errors']}")
-    else:
-        logger.warning("No distribution data to insert - check option matching")
+    Returns:
+        Number of ratings inserted
+    """
+    return write_survey_responses(course_offering_id, survey_responses, context, mode='insert')
 
 
-def process_ctec_batch(upload_dir: Path, dry_run: bool = False, parser_config: Optional[ParserConfig] = None) -> Dict:
+def process_ctec_batch(upload_dir: Path, dry_run: bool = False, parser_config: Optional[ParserConfig] = None, max_workers: Optional[int] = None, results_path: Optional[Path] = None) -> Dict:
     """
     Process all CTEC PDFs in a directory.
     
+    PDFs are parsed in parallel worker processes; uploads stay in this process
+    and run as each parse completes, overlapping with the parses still running.
+    At most two parses per worker are in flight so finished-but-not-uploaded
+    results can't pile up in memory. Per-file results are not kept; they are
+    streamed to results_path as JSON Lines when one is given.
+    
     Args:
         upload_dir: Directory containing CTEC PDFs
         dry_run: If True, preview changes without applying
         parser_config: Optional parser configuration
+        max_workers: Number of parser processes (default: CPU count)
+        results_path: Optional JSON Lines file to write each file's result to
         
     Returns:
         Dictionary with batch processing results
     """
     logger = get_job_logger('batch_ctec')
-    logger.info(f"Starting batch CTEC processing from {upload_dir}")
+    logger.info("Starting batch CTEC processing from %s", upload_dir)
     
     if dry_run:
         logger.info("🔍 DRY RUN MODE - No changes will be made")
@@ -503,7 +582,11 @@ def process_ctec_batch(upload_dir: Path, dry_run: bool = False, parser_config: O
         if not confirm_operation(f"Process {len(pdf_files)} CTEC files?"):
             return {'cancelled': True}
     
+    # Fetch lookups once for the whole batch
+    context = None if dry_run else build_upload_context()
+    
     # Process files
+    start_clock = time.perf_counter()
     results = {
         'total_files': len(pdf_files),
         'successful_uploads': 0,
@@ -511,36 +594,73 @@ def process_ctec_batch(upload_dir: Path, dry_run: bool = False, parser_config: O
         'upload_failures': 0,
         'success_rate': 0.0,
         'start_time': datetime.now().isoformat(),
-        'files_processed': [],
+        'results_path': str(results_path) if results_path else None,
         'errors': []
     }
     
-    for pdf_file in pdf_files:
-        result = parse_and_upload_ctec(pdf_file, dry_run=dry_run, parser_config=parser_config)
+    workers = min(len(pdf_files), max_workers or os.cpu_count() or 1)
+    logger.info("Parsing %d files with %d worker processes", len(pdf_files), workers)
+    
+    pending_files = iter(pdf_files)
+    
+    if results_path:
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(results_path, 'wb') if results_path else nullcontext() as results_file, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
         
-        results['files_processed'].append(result)
+        def submit_next() -> None:
+            pdf_file = next(pending_files, None)
+            if pdf_file is not None:
+                futures[executor.submit(parse_ctec_file, pdf_file, parser_config)] = pdf_file
         
-        if result['status'] == 'success':
-            if result['upload_results'].get('uploaded'):
-                results['successful_uploads'] += 1
-            else:
-                results['upload_failures'] += 1
-                results['errors'].extend(result['upload_results'].get('errors', []))
-        else:
-            results['parse_failures'] += 1
-            results['errors'].append(f"{result['file']}: {result.get('error', 'Unknown error')}")
+        for _ in range(workers * 2):
+            submit_next()
         
-        logger.info(f"Processed {result['file']}: {result['status']}")
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            future = next(iter(done))
+            pdf_file = futures.pop(future)
+            
+            # Keep workers busy parsing while this result is uploaded
+            submit_next()
+            
+            try:
+                ctec_data = future.result()
+            except Exception as e:
+                logger.error("Failed to process %s: %s", pdf_file.name, e)
+                result = {
+                    'status': 'error',
+                    'file': pdf_file.name,
+                    'error': str(e)
+                }
+            else:
+                logger.info("Successfully parsed CTEC for %s", ctec_data.course_info.code)
+                result = upload_parsed_ctec(pdf_file, ctec_data, dry_run, context)
+            
+            if results_file is not None:
+                write_json_line(results_file, result)
+            
+            if result['status'] == 'success':
+                if result['upload_results'].get('uploaded'):
+                    results['successful_uploads'] += 1
+                else:
+                    results['upload_failures'] += 1
+                    results['errors'].extend(result['upload_results'].get('errors', []))
+            else:
+                results['parse_failures'] += 1
+                results['errors'].append(f"{result['file']}: {result.get('error', 'Unknown error')}")
+            
+            logger.info("Processed %s: %s", result['file'], result['status'])
     
     # Calculate final stats
-    end_time = datetime.now()
-    start_time = datetime.fromisoformat(results['start_time'])
-    total_time = str(end_time - start_time)
+    total_time = timedelta(seconds=time.perf_counter() - start_clock)
     
-    results['end_time'] = end_time.isoformat()
-    results['total_time'] = total_time
+    results['end_time'] = datetime.now().isoformat()
+    results['total_time'] = str(total_time)
     results['success_rate'] = (results['successful_uploads'] / results['total_files']) * 100
     
-    logger.info(f"Batch processing complete: {results['successful_uploads']}/{results['total_files']} successful")
+    logger.info("Batch processing complete: %d/%d successful", results['successful_uploads'], results['total_files'])
     
     return results
\ No newline at end of file
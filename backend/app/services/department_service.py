@@ -4,7 +4,6 @@ Department service - Business logic for department operations.
 Orchestrates department scraping, validation, and database operations.
 """
 
-import re
 from typing import Dict, List, Optional
 from pathlib import Path
 
@@ -46,13 +45,13 @@ def extract_department_code_from_course(course_code: str) -> Optional[str]:
         logger.warning("Empty course_code provided")
         return None
     
-    # Extract everything before the last underscore
-    if '_' not in course_code:
+    # Extract everything before the last underscore (single scan, no list allocation)
+    dept_code, separator, _ = course_code.rpartition('_')
+    
+    if not separator:
         logger.warning(f"Invalid format (no underscore): {course_code}")
         return None
     
-    dept_code = course_code.rsplit('_', 1)[0]
-    
     if not dept_code:
         logger.warning(f"Empty department code extracted from: {course_code}")
         return None
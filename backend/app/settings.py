@@ -28,6 +28,7 @@ class Settings:
     DEFAULT_BATCH_SIZE: int = 100
     DEFAULT_DELAY_SECONDS: float = 0.5
     DEFAULT_MAX_WORKERS: int = 3
+    CATALOG_UPSERT_BATCH_SIZE: int = int(os.getenv("CATALOG_UPSERT_BATCH_SIZE", "500"))
     
     # Validation
     def __post_init__(self):
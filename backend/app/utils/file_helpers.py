@@ -3,9 +3,12 @@ Common file and data operations.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+import orjson
 
 def load_json_file(file_path: Path, description: str = "data") -> List[Dict]:
     """
@@ -22,8 +25,7 @@ def load_json_file(file_path: Path, description: str = "data") -> List[Dict]:
         SystemExit on file not found or invalid JSON
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(Path(file_path).read_bytes())
         
         print(f"📂 Loaded {len(data) if isinstance(data, list) else 'JSON'} {description} from {file_path}")
         return data
@@ -50,16 +52,57 @@ def save_json_file(data: Any, file_path: Path, description: str = "data") -> Pat
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
     
     print(f"💾 Saved {description} to: {file_path}")
     return file_path
 
+def save_json_array_streaming(items: Iterable[Any], file_path: Path, description: str = "data") -> Path:
+    """
+    Save items as a JSON array, writing one element per line as it is encoded.
+    
+    Unlike save_json_file, elements are encoded one at a time without
+    indentation, so the whole array is never held in memory as one string.
+    The output is still a plain JSON array, so load_json_file reads it back
+    unchanged.
+    
+    Args:
+        items: Iterable of JSON-serializable elements
+        file_path: Output file path
+        description: Description for logging
+        
+    Returns:
+        Path to saved file
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(file_path, 'wb') as f:
+        f.write(b'[')
+        for i, item in enumerate(items):
+            f.write(b',\n' if i else b'\n')
+            f.write(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS))
+        f.write(b'\n]\n')
+    
+    print(f"💾 Saved {description} to: {file_path}")
+    return file_path
+
+def write_json_line(f: BinaryIO, item: Any) -> None:
+    """
+    Append one JSON value as a single line (JSON Lines) to a binary file.
+    
+    Args:
+        f: File opened in binary write/append mode
+        item: JSON-serializable value
+    """
+    f.write(orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+
 def find_pdf_files(directory: Path) -> List[Path]:
     """
     Find all PDF files in a directory.
     
+    Uses a single os.scandir pass, so callers can rely on every returned path
+    being an existing regular file with a .pdf suffix (any case).
+    
     Args:
         directory: Directory to search
         
@@ -70,7 +113,11 @@ def find_pdf_files(directory: Path) -> List[Path]:
         print(f"❌ Directory not found: {directory}")
         return []
     
-    pdf_files = list(directory.glob("*.pdf"))
+    with os.scandir(directory) as entries:
+        pdf_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.lower().endswith('.pdf') and entry.is_file()
+        ]
     print(f"📁 Found {len(pdf_files)} PDF files in {directory}")
     
     return sorted(pdf_files)
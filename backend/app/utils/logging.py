@@ -4,6 +4,7 @@ Standardized logging configuration for the application.
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -51,8 +52,14 @@ def setup_logger(
     
     return logger
 
+@lru_cache(maxsize=None)
 def get_job_logger(job_name: str) -> logging.Logger:
-    """Get a logger configured for job scripts."""
+    """
+    Get a logger configured for job scripts.
+    
+    Cached per job name, so helpers can call this on every invocation without
+    re-creating handlers (and re-opening the log file) each time.
+    """
     from ..settings import settings
     
     log_file = settings.SCRAPED_DATA_DIR / f"{job_name}.log"
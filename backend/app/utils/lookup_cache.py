@@ -0,0 +1,35 @@
+"""
+In-process TTL cache for database lookup maps.
+
+Lookups that are set up once and rarely change, such as survey questions,
+are reused across operations within one process instead of being refetched
+every time.
+"""
+
+import time
+from typing import Any, Callable, Dict, Tuple
+
+LOOKUP_CACHE_TTL_SECONDS = 300
+_lookup_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def get_cached_lookup(name: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Get a lookup map, fetching it from the database at most once per TTL.
+    
+    Args:
+        name: Cache key for the lookup
+        loader: Function that fetches the lookup map from the database
+        
+    Returns:
+        A copy of the lookup map, safe for the caller to mutate
+    """
+    cached = _lookup_cache.get(name)
+    if cached is None or time.monotonic() - cached[0] > LOOKUP_CACHE_TTL_SECONDS:
+        lookup = loader()
+        if not lookup:
+            # Don't cache failed (empty) fetches
+            return lookup
+        cached = (time.monotonic(), lookup)
+        _lookup_cache[name] = cached
+    return dict(cached[1])